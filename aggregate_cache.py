@@ -0,0 +1,135 @@
+"""
+On-disk cache of computed aggregates, stored as columnar Arrow IPC files.
+
+Entries are keyed by a content hash of the source file plus the aggregation code version, so an edited
+input or a change to the aggregation logic produces a new key and the stale entry is removed.
+Arrow IPC files are uncompressed and column-aligned, so cold starts read them through a memory map
+instead of recomputing (converting to pandas still copies each column into its own buffer).
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.ipc
+
+HASH_BLOCK_SIZE = 8 * 1024 * 1024
+STAT_INDEX_FILE = 'source_hashes.json'
+
+
+def _load_json(path):
+    try:
+        with open(path) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as fh:
+        json.dump(payload, fh, indent=2)
+    os.replace(tmp_path, path)
+
+
+def file_digest(path, cache_dir):
+    """
+    Returns the SHA-256 of the file contents.
+    Digests are remembered against (size, mtime) so an unchanged file is not re-read on every cold start.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stat_key = f"{stat.st_size}:{stat.st_mtime_ns}"
+    index_path = os.path.join(cache_dir, STAT_INDEX_FILE)
+    index = _load_json(index_path)
+    known = index.get(path)
+    if known and known['stat'] == stat_key:
+        return known['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    index[path] = {'stat': stat_key, 'sha256': digest.hexdigest()}
+    os.makedirs(cache_dir, exist_ok=True)
+    _write_json(index_path, index)
+    return digest.hexdigest()
+
+
+def cache_key(source_path, code_version, cache_dir):
+    """Builds the cache key from the source content hash and the aggregation code version."""
+    return hashlib.sha256(f"{file_digest(source_path, cache_dir)}:{code_version}".encode()).hexdigest()[:32]
+
+
+def _entry_dir(cache_dir, key):
+    return os.path.join(cache_dir, 'aggregates', key)
+
+
+def write_frames(cache_dir, key, frames, meta=None):
+    """Writes a dict of DataFrames as one Arrow IPC file each, plus a meta.json describing the entry."""
+    entry = _entry_dir(cache_dir, key)
+    tmp_entry = f"{entry}.tmp"
+    shutil.rmtree(tmp_entry, ignore_errors=True)
+    os.makedirs(tmp_entry)
+    for name, df in frames.items():
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(os.path.join(tmp_entry, f"{name}.arrow"), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    _write_json(os.path.join(tmp_entry, 'meta.json'), {'frames': sorted(frames), **(meta or {})})
+    # Publish the entry atomically so concurrent readers never see a half-written directory
+    shutil.rmtree(entry, ignore_errors=True)
+    os.replace(tmp_entry, entry)
+
+
+def read_frames(cache_dir, key, names=None):
+    """
+    Reads a cached entry through a memory map and returns (frames, meta), or (None, None) when the key is not cached.
+    The frames are pandas copies of the Arrow columns, so they stay valid after the files are replaced.
+    `names` restricts loading to those frames; by default every frame of the entry is loaded.
+    """
+    entry = _entry_dir(cache_dir, key)
+    meta = _load_json(os.path.join(entry, 'meta.json'))
+    if not meta:
+        return None, None
+    frames = {}
+    for name in meta['frames'] if names is None else names:
+        with pa.memory_map(os.path.join(entry, f"{name}.arrow"), 'r') as source:
+            frames[name] = pa.ipc.open_file(source).read_all().to_pandas()
+    return frames, meta
+
+
+def evict_stale(cache_dir, source_path, keep_key):
+    """Removes every cached entry built from `source_path` other than `keep_key`."""
+    root = os.path.join(cache_dir, 'aggregates')
+    if not os.path.isdir(root):
+        return
+    source_path = os.path.abspath(source_path)
+    for key in os.listdir(root):
+        if key == keep_key or key.endswith('.tmp'):
+            continue
+        meta = _load_json(os.path.join(root, key, 'meta.json'))
+        if meta.get('source_path') == source_path:
+            shutil.rmtree(os.path.join(root, key), ignore_errors=True)
+
+
+def load_or_build(source_path, code_version, cache_dir, build, names=None):
+    """
+    Returns (frames, stats) for `source_path`, served from the cache when the source and code are unchanged.
+    `build` is called on a miss and must return (frames, stats); its result is written back to the cache.
+    `names` limits which frames are read on a cache hit.
+    """
+    key = cache_key(source_path, code_version, cache_dir)
+    frames, meta = read_frames(cache_dir, key, names)
+    if frames is not None:
+        return frames, {**meta.get('stats', {}), 'cache': 'hit', 'cache_key': key}
+
+    frames, stats = build()
+    write_frames(cache_dir, key, frames, meta={
+        'source_path': os.path.abspath(source_path),
+        'code_version': code_version,
+        'stats': stats,
+    })
+    evict_stale(cache_dir, source_path, key)
+    return frames, {**stats, 'cache': 'miss', 'cache_key': key}
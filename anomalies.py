@@ -0,0 +1,136 @@
+"""
+Anomaly and outage detection over the daily series of every Domain-City pair.
+
+The pair series are one (pairs x days) matrix per measure, taken from the cube. Each day is scored by a
+robust z-score against the trailing window before it: (x - median) / (1.4826 * MAD), with the medians
+taken over a sliding-window view of the whole matrix at once, so there is no per-series loop. A day is
+an anomaly when either measure's |z| exceeds the threshold (3.5, the usual modified z-score cut-off),
+and an outage when a pair recorded no rows on a day after its first active day.
+
+Scans extend incrementally: when the new cube only adds days to the one scanned before (same pairs,
+same history), only the new days are scored, each with its own trailing window.
+"""
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bump when the scan layout or scoring changes, so cached scans from older code are recomputed
+VERSION = 1
+
+WINDOW = 28
+THRESHOLD = 3.5
+MAD_SCALE = 1.4826
+MEASURES = ['total_value', 'total_transactions']
+
+
+def robust_z(values, window=WINDOW, start=0):
+    """
+    Scores days [max(start, window), days) of `values` (series x days) against their trailing `window` days.
+    Returns (z, median), each series x scored days.
+    """
+    first = max(start, window)
+    n_series, n_days = values.shape
+    if first >= n_days:
+        return np.empty((n_series, 0)), np.empty((n_series, 0))
+    # Window k holds days first - window + k .. first + k - 1, the days before day first + k
+    windows = sliding_window_view(values[:, first - window:n_days - 1], window, axis=1)
+    median = np.median(windows, axis=2)
+    mad = np.median(np.abs(windows - median[:, :, None]), axis=2)
+    # A flat window has MAD 0; a small floor keeps its z finite and still flags any change
+    scale = np.maximum(MAD_SCALE * mad, 1e-6 * np.abs(median) + 1e-12)
+    return (values[:, first:] - median) / scale, median
+
+
+def _pair_matrices(cube):
+    recorded = cube.rows.sum(axis=2) > 0
+    return recorded, {
+        'total_value': cube.value[recorded].astype('float64'),
+        'total_transactions': cube.transactions[recorded].astype('float64'),
+    }, cube.rows[recorded]
+
+
+def _outages(rows):
+    """Days with no rows after the pair's first recorded day."""
+    empty = rows == 0
+    return empty & (np.cumsum(~empty, axis=1) > 0)
+
+
+def scan(cube, window=WINDOW, previous=None):
+    """
+    Scores every pair-day of the cube. With `previous` (an earlier scan of the same pairs whose days
+    are a prefix of this cube), only the new days are scored. Returns a dict of series x days arrays
+    (values, z-scores, window medians, outage flags) plus the pair mask and dates.
+    """
+    pairs, values, rows = _pair_matrices(cube)
+    start = 0
+    if previous is not None and previous['window'] == window and _extends(previous, pairs, cube.dates, values):
+        start = len(previous['dates'])
+
+    result = {'pairs': pairs, 'dates': cube.dates, 'window': window, 'outage': _outages(rows)}
+    for measure, matrix in values.items():
+        z, median = robust_z(matrix, window, start)
+        # Days inside the first window have no score; a previous scan may stop before the window is full
+        pad = np.full((len(matrix), min(max(start, window), matrix.shape[1]) - start), np.nan)
+        if start:
+            z = np.hstack([previous[f'z:{measure}'], pad, z])
+            median = np.hstack([previous[f'median:{measure}'], pad, median])
+        else:
+            z, median = np.hstack([pad, z]), np.hstack([pad, median])
+        result[measure] = matrix
+        result[f'z:{measure}'] = z
+        result[f'median:{measure}'] = median
+    result['scored_days'] = len(cube.dates) - start
+    return result
+
+
+def _extends(previous, pairs, dates, values):
+    """True if this cube only appends days to the previously scanned one."""
+    days = len(previous['dates'])
+    return (
+        np.array_equal(previous['pairs'], pairs)
+        and len(dates) >= days
+        and dates[:days].equals(previous['dates'])
+        and all(np.array_equal(values[m][:, :days], previous[m]) for m in MEASURES)
+    )
+
+
+def flagged(result, cube, threshold=THRESHOLD):
+    """One row per anomalous or outage pair-day: Domain, Location, Date, Kind, values, expected values and z-scores."""
+    domain_idx, location_idx = np.nonzero(result['pairs'])
+    z_value, z_count = result['z:total_value'], result['z:total_transactions']
+    with np.errstate(invalid='ignore'):
+        strength = np.fmax(np.abs(z_value), np.abs(z_count))
+        mask = (strength > threshold) | result['outage']
+    pair, day = np.nonzero(mask)
+    kind = np.where(result['outage'][pair, day], 'outage', np.where(z_value[pair, day] >= 0, 'spike', 'dip'))
+    frame = pd.DataFrame({
+        'Domain': cube.domains[domain_idx[pair]],
+        'Location': cube.locations[location_idx[pair]],
+        'Date': result['dates'][day],
+        'Kind': kind,
+        'total_value': result['total_value'][pair, day],
+        'expected_value': result['median:total_value'][pair, day],
+        'z_value': z_value[pair, day],
+        'total_transactions': result['total_transactions'][pair, day],
+        'expected_transactions': result['median:total_transactions'][pair, day],
+        'z_transactions': z_count[pair, day],
+        'strength': strength[pair, day],
+    })
+    return frame.sort_values('strength', ascending=False, ignore_index=True)
+
+
+def pairs_per_location(result, cube):
+    """Number of scanned pairs per Location."""
+    _, location_idx = np.nonzero(result['pairs'])
+    counts = pd.Series(np.bincount(location_idx, minlength=len(cube.locations)), index=cube.locations, name='pairs')
+    return counts[counts > 0]
+
+
+def location_report(flags, pairs, days):
+    """Per Location (of `pairs`, see pairs_per_location): scanned pair-days and spike, dip and outage pair-days."""
+    counts = flags.groupby(['Location', 'Kind']).size().unstack(fill_value=0)
+    report = pd.DataFrame({'Location': pairs.index, 'pairs': pairs.to_numpy()})
+    report['pair_days'] = report['pairs'] * days
+    for kind in ['spike', 'dip', 'outage']:
+        report[kind] = report['Location'].map(counts[kind] if kind in counts else {}).fillna(0).astype('int64')
+    return report
@@ -0,0 +1,210 @@
+"""
+Versioned dashboard artifacts written by batch.py and read by the dashboard.
+
+Layout of the artifact directory:
+    LATEST                          name of the newest complete version
+    <version>/manifest.json         source, code versions, parameters, stage timings and every file's size and SHA-256
+    <version>/tables/<name>.arrow   typed summary tables, sketches, segmentation, K scores and anomaly flags (Arrow IPC)
+    <version>/arrays/<name>.npy     cube measures and forecast model arrays (memory-mapped on read)
+    <version>/stores/<name>.bin     memory-mapped feature stores: the segmented pair features and model (feature_store.py)
+    <version>/figures/<key>.<fmt>   pre-rendered figures, named by figure_cache.figure_key
+
+A version is written under a temporary name and renamed into place before LATEST is switched to it, so
+readers only ever see complete versions; a published version is never overwritten, and older versions
+beyond `keep` are removed after publishing.
+"""
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+
+from cube import Cube
+from feature_store import FeatureStore
+
+MANIFEST_FILE = 'manifest.json'
+LATEST_FILE = 'LATEST'
+# Versions named in this process, so two runs in the same second still get distinct names
+_SEQUENCE = itertools.count()
+SUBDIRS = ('tables', 'arrays', 'stores', 'figures')
+SUFFIXES = {'tables': '.arrow', 'arrays': '.npy', 'stores': '.bin'}
+
+
+def latest_version(root):
+    """Name of the newest published version under `root`, or None."""
+    try:
+        with open(os.path.join(root, LATEST_FILE)) as fh:
+            version = fh.read().strip()
+    except OSError:
+        return None
+    return version if version and os.path.exists(os.path.join(root, version, MANIFEST_FILE)) else None
+
+
+def new_version(source_digest=None):
+    """
+    Sortable, unique version name: UTC timestamp, process id and a per-process sequence number, plus the
+    start of the source hash when there is one.
+    """
+    stamp = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+    name = f"{stamp}-{os.getpid()}.{next(_SEQUENCE)}"
+    return f"{name}-{source_digest[:12]}" if source_digest else name
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(8 * 1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ArtifactWriter:
+    """Collects the files of one version in a temporary directory until `publish`."""
+
+    def __init__(self, root, version):
+        self.root = root
+        self.version = version
+        self.tmp_dir = os.path.join(root, f"{version}.tmp")
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        for sub in SUBDIRS:
+            os.makedirs(os.path.join(self.tmp_dir, sub))
+
+    def table(self, name, df):
+        """Writes one DataFrame as tables/<name>.arrow."""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(os.path.join(self.tmp_dir, 'tables', f"{name}.arrow"), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def array(self, name, array):
+        """Writes one NumPy array as arrays/<name>.npy."""
+        np.save(os.path.join(self.tmp_dir, 'arrays', f"{name}.npy"), np.ascontiguousarray(array))
+
+    def store_path(self, name):
+        """Path of stores/<name>.bin, for a feature store written by feature_store.write_feature_store."""
+        return os.path.join(self.tmp_dir, 'stores', f"{name}.bin")
+
+    def figure(self, key, fmt, payload):
+        """Writes one encoded figure as figures/<key>.<fmt>."""
+        with open(os.path.join(self.tmp_dir, 'figures', f"{key}.{fmt}"), 'wb') as fh:
+            fh.write(payload)
+
+    def publish(self, manifest, keep=3):
+        """Writes the manifest (with every file's size and hash), moves the version into place and switches LATEST to it."""
+        files = {}
+        for sub in SUBDIRS:
+            for name in sorted(os.listdir(os.path.join(self.tmp_dir, sub))):
+                path = os.path.join(self.tmp_dir, sub, name)
+                files[f"{sub}/{name}"] = {'bytes': os.path.getsize(path), 'sha256': _sha256(path)}
+        manifest = {'version': self.version, 'created': time.time(), **manifest, 'files': files}
+        with open(os.path.join(self.tmp_dir, MANIFEST_FILE), 'w') as fh:
+            json.dump(manifest, fh, indent=2, default=str)
+
+        final_dir = os.path.join(self.root, self.version)
+        # A published version may be what LATEST points to and readers are mapping; it is never replaced
+        if os.path.exists(final_dir):
+            raise FileExistsError(f"Artifact version {self.version} is already published in {self.root}")
+        os.replace(self.tmp_dir, final_dir)
+        latest_tmp = os.path.join(self.root, f"{LATEST_FILE}.tmp")
+        with open(latest_tmp, 'w') as fh:
+            fh.write(self.version)
+        os.replace(latest_tmp, os.path.join(self.root, LATEST_FILE))
+        prune(self.root, keep)
+        return manifest
+
+
+def prune(root, keep=3):
+    """Removes all but the newest `keep` published versions (never the LATEST one)."""
+    current = latest_version(root)
+    versions = sorted(
+        name for name in os.listdir(root)
+        if not name.endswith('.tmp') and os.path.exists(os.path.join(root, name, MANIFEST_FILE))
+    )
+    for name in versions[:-keep] if keep > 0 else versions:
+        if name != current:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+class Artifacts:
+    """Read access to one published version."""
+
+    def __init__(self, root, version):
+        self.root = root
+        self.version = version
+        self.path = os.path.join(root, version)
+        with open(os.path.join(self.path, MANIFEST_FILE)) as fh:
+            self.manifest = json.load(fh)
+
+    def has(self, kind, name):
+        """True if the version holds tables/<name>.arrow, arrays/<name>.npy or stores/<name>.bin (by `kind`)."""
+        return f"{kind}/{name}{SUFFIXES[kind]}" in self.manifest['files']
+
+    def table(self, name):
+        """Reads tables/<name>.arrow through a memory map into a DataFrame (pandas copies the columns)."""
+        with pa.memory_map(os.path.join(self.path, 'tables', f"{name}.arrow"), 'r') as source:
+            return pa.ipc.open_file(source).read_all().to_pandas()
+
+    def array(self, name):
+        """Memory-maps arrays/<name>.npy (read-only)."""
+        return np.load(os.path.join(self.path, 'arrays', f"{name}.npy"), mmap_mode='r')
+
+    def feature_store(self, name):
+        """Memory-maps stores/<name>.bin as a FeatureStore."""
+        return FeatureStore(os.path.join(self.path, 'stores', f"{name}.bin"))
+
+    def figures(self, fmt):
+        """Yields (figure key, encoded bytes) of every pre-rendered figure in `fmt`."""
+        for name in self.manifest['files']:
+            if name.startswith('figures/') and name.endswith(f".{fmt}"):
+                with open(os.path.join(self.path, name), 'rb') as fh:
+                    yield os.path.basename(name)[:-len(fmt) - 1], fh.read()
+
+    def cube(self):
+        """The Domain x Location x Day cube, with its measures memory-mapped."""
+        axes = self.manifest['cube']
+        dates = pd.date_range(axes['start'], periods=axes['days'], freq='D')
+        return Cube(
+            np.asarray(axes['domains']), np.asarray(axes['locations']), dates,
+            self.array('cube.value'), self.array('cube.transactions'), self.array('cube.rows'),
+        )
+
+    def forecast_models(self):
+        """Fitted forecasting models in the layout of forecasting.fit_cube, or None if this version has none."""
+        meta = self.manifest.get('forecast')
+        if meta is None:
+            return None
+        models = {'pairs': self.array('forecast.pairs'), 'last_date': pd.Timestamp(meta['last_date'])}
+        for measure, scalars in meta['models'].items():
+            models[measure] = {key: self.array(f"forecast.{measure}.{key}") for key in meta['arrays']}
+            models[measure].update(scalars)
+        return models
+
+
+def write_cube(writer, cube):
+    """Stores the cube's measures as arrays; returns its axes for the manifest."""
+    for measure in ('value', 'transactions', 'rows'):
+        writer.array(f"cube.{measure}", getattr(cube, measure))
+    return {
+        'domains': [str(d) for d in cube.domains],
+        'locations': [str(l) for l in cube.locations],
+        'start': cube.dates[0].strftime('%Y-%m-%d'),
+        'days': len(cube.dates),
+    }
+
+
+def write_forecast_models(writer, models, measures):
+    """Stores forecasting.fit_cube models as arrays; returns their scalars for the manifest."""
+    writer.array('forecast.pairs', models['pairs'])
+    arrays = sorted(key for key, value in models[measures[0]].items() if isinstance(value, np.ndarray))
+    meta = {'last_date': pd.Timestamp(models['last_date']).strftime('%Y-%m-%d'), 'arrays': arrays, 'models': {}}
+    for measure in measures:
+        for key in arrays:
+            writer.array(f"forecast.{measure}.{key}", models[measure][key])
+        meta['models'][measure] = {key: value for key, value in models[measure].items() if key not in arrays}
+    return meta
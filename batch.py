@@ -0,0 +1,188 @@
+"""
+Headless batch job that precomputes every dashboard artifact.
+
+Runs ingestion (on the ingest process pool), the Domain x Location x Day cube, its summary tables and sketches,
+K-Means model selection and the k=3 segmentation (as a memory-mapped feature store), the per-pair forecasts, the anomaly scan and the
+matplotlib figures, and publishes them as one versioned artifact set (see artifacts.py). A dashboard
+started with REC_SSEC_ARTIFACT_DIR pointing at the same directory only reads these files, so it needs
+neither the raw file nor scikit-learn nor a rendering pass, and picks up each new version on its next rerun.
+
+Usage:
+    python batch.py --data transactions.csv --out artifacts/
+    python batch.py --incremental --out artifacts/      # from the incremental aggregate state
+    python batch.py --workers 16 --keep 5               # nightly run on every core, keep 5 versions
+"""
+import argparse
+import os
+import time
+import warnings
+
+import artifacts
+from aggregate_cache import load_or_build
+from config import (
+    ANOMALY_THRESHOLD, ANOMALY_WINDOW, ARTIFACT_DIR, CACHE_DIR, CHUNK_SIZE, CLUSTER_GRAIN, CLUSTER_K_MAX,
+    CLUSTER_REFIT, CLUSTER_SEEDS, CLUSTER_WORKERS, DATA_PATH, FIGURE_FORMAT, FORECAST_WORKERS, INGEST_WORKERS,
+)
+from cube import ROLLUPS, Cube
+from ingestion import AGGREGATION_VERSION
+from parallel_ingest import parallel_transactions
+from schema import apply_schema
+
+MEASURES = ['total_value', 'total_transactions']
+
+
+class _Stages:
+    """Times named stages and prints one progress line per stage."""
+
+    def __init__(self, verbose=True):
+        self.seconds = {}
+        self.verbose = verbose
+
+    def run(self, name, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.seconds[name] = time.perf_counter() - start
+        if self.verbose:
+            print(f"{name:<20} {self.seconds[name]:8.2f}s")
+        return result
+
+
+def load_cells(data_path, chunksize, workers, incremental):
+    """Returns ({'cells', 'sketches'} frames, ingest stats, source digest) from the raw file or the incremental state."""
+    if incremental:
+        from incremental import load_incremental_summaries
+        frames, stats = load_incremental_summaries(CACHE_DIR, data_path, chunksize)
+        if frames is None:
+            raise SystemExit("No incremental state and no source file to bootstrap it from.")
+        return frames, stats, None
+    if not data_path:
+        raise SystemExit("No source file: pass --data or set REC_SSEC_DATA_PATH.")
+    frames, stats = load_or_build(
+        data_path, AGGREGATION_VERSION, CACHE_DIR,
+        lambda: parallel_transactions(data_path, chunksize, workers),
+        names=['cells', 'sketches'],
+    )
+    return frames, stats, stats['cache_key']
+
+
+def render_figures(writer, tables, k_scores, forecast_models, cube, fmt):
+    """
+    Renders the matplotlib figures of the unfiltered dashboard from exactly the frames its sections pass,
+    so each file is named by the figure key the dashboard looks up. Returns ({plot name: figure key}, dpi).
+    """
+    import forecasting
+    import plots
+    from figure_cache import FigureCache, figure_key
+    from ranking import RANK_KEYS, RANK_METRICS, RankIndex, top_k
+    from shared_cache import SharedCache
+
+    regional = tables['regional_perf']
+    ranks = RankIndex.build(regional, RANK_METRICS['regional_perf'], RANK_KEYS['regional_perf'])
+    inputs = {
+        'plot_top_10_regional': tuple(top_k(regional, ranks, metric) for metric in MEASURES),
+        'plot_temporal_trends': (tables['monthly_summary'], tables['daily_summary']),
+        'plot_domain_location_matrix': (tables['dc'],),
+        'plot_clustering_scores': (k_scores, k_scores.dropna(subset=['Score'])),
+    }
+    if forecast_models is not None:
+        horizon = forecasting.quarter_horizon(forecast_models['last_date'])
+        monthly = [forecasting.grouped_forecasts(forecast_models, cube, measure, horizon)[1] for measure in MEASURES]
+        inputs['plot_forecast'] = (tables['monthly_summary'], *monthly)
+
+    figure_cache = FigureCache(SharedCache(max_bytes=0), fmt=fmt)
+    keys = {}
+    for name, frames in inputs.items():
+        plot_fn = getattr(plots, name)
+        keys[name] = figure_key(plot_fn, frames, {})
+        writer.figure(keys[name], fmt, figure_cache.render(plot_fn, *frames))
+    return keys, figure_cache.dpi
+
+
+def run_batch(data_path=DATA_PATH, out_dir=ARTIFACT_DIR, chunksize=CHUNK_SIZE, incremental=False,
+              ingest_workers=INGEST_WORKERS, cluster_workers=CLUSTER_WORKERS, forecast_workers=FORECAST_WORKERS,
+              figures=True, fmt=FIGURE_FORMAT, keep=3, verbose=True):
+    """Computes every artifact and publishes them as a new version under `out_dir`; returns the manifest."""
+    import anomalies
+    import forecasting
+    from clustering import cluster_pair_days, model_selection, segment_pairs, write_pair_store
+
+    stages = _Stages(verbose)
+    source, ingest_stats, digest = stages.run('ingest', load_cells, data_path, chunksize, ingest_workers, incremental)
+    writer = artifacts.ArtifactWriter(out_dir, artifacts.new_version(digest))
+    manifest = {
+        'source': {'path': os.path.abspath(data_path) if data_path else None, 'incremental': incremental, 'key': digest},
+        'code': {
+            'aggregation': AGGREGATION_VERSION, 'forecasting': forecasting.VERSION, 'anomalies': anomalies.VERSION,
+        },
+        'ingest': ingest_stats,
+    }
+
+    cube = stages.run('cube', Cube.from_cells, source['cells'])
+    manifest['cube'] = artifacts.write_cube(writer, cube)
+    writer.table('sketches', source['sketches'])
+    tables = stages.run('tables', lambda: {name: apply_schema(cube.rollup(name), name) for name in ROLLUPS})
+    for name, table in tables.items():
+        writer.table(name, table)
+
+    k_scores, k_stats = stages.run(
+        'model_selection', model_selection, tables['dc'], CACHE_DIR,
+        k_max=CLUSTER_K_MAX, n_seeds=CLUSTER_SEEDS, workers=cluster_workers,
+    )
+    writer.table('k_scores', k_scores)
+    segmented, model = stages.run('segment', segment_pairs, tables['dc'], CACHE_DIR, refit=CLUSTER_REFIT)
+    write_pair_store(writer.store_path('pair_features'), segmented, model, segmented['Cluster'])
+    manifest['clustering'] = {'k_max': CLUSTER_K_MAX, 'seeds': CLUSTER_SEEDS, 'k_stats': k_stats}
+    if CLUSTER_GRAIN == 'pair_day' and data_path and not incremental:
+        profile, pair_day_stats = stages.run(
+            'pair_day_clusters', cluster_pair_days,
+            data_path, os.path.join(CACHE_DIR, 'pair_day_clusters.arrow'), chunksize=chunksize,
+        )
+        writer.table('pair_day_profile', profile)
+        manifest['clustering']['pair_day_stats'] = pair_day_stats
+
+    forecast_models = None
+    if len(cube.dates) >= 2 * forecasting.SEASON:
+        forecast_models = stages.run('forecast', forecasting.fit_cube, cube, forecast_workers)
+        manifest['forecast'] = artifacts.write_forecast_models(writer, forecast_models, MEASURES)
+
+    if len(cube.dates) > ANOMALY_WINDOW:
+        result = stages.run('anomalies', anomalies.scan, cube, ANOMALY_WINDOW)
+        writer.table('anomaly_flags', anomalies.flagged(result, cube, ANOMALY_THRESHOLD))
+        writer.table('anomaly_pairs', anomalies.pairs_per_location(result, cube).rename_axis('Location').reset_index())
+        manifest['anomalies'] = {'window': ANOMALY_WINDOW, 'threshold': ANOMALY_THRESHOLD}
+
+    if figures:
+        keys, dpi = stages.run('figures', render_figures, writer, tables, k_scores, forecast_models, cube, fmt)
+        manifest['figures'] = {'format': fmt, 'dpi': dpi, 'keys': keys}
+
+    manifest['stages'] = stages.seconds
+    return stages.run('publish', writer.publish, manifest, keep)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute and publish every dashboard artifact.")
+    parser.add_argument('--data', default=DATA_PATH, help="Raw transaction CSV (default: REC_SSEC_DATA_PATH)")
+    parser.add_argument('--out', default=ARTIFACT_DIR or os.path.join(CACHE_DIR, 'artifacts'),
+                        help="Artifact directory (default: REC_SSEC_ARTIFACT_DIR, else <cache dir>/artifacts)")
+    parser.add_argument('--incremental', action='store_true', help="Read the incremental aggregate state instead of --data")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_SIZE, help="Rows per read chunk")
+    parser.add_argument('--workers', type=int, help="Processes for every parallel stage (default: per-stage settings)")
+    parser.add_argument('--no-figures', action='store_true', help="Skip pre-rendering the matplotlib figures")
+    parser.add_argument('--keep', type=int, default=3, help="Published versions to keep")
+    args = parser.parse_args()
+    # The plots pass seaborn a palette without hue, the dashboard's look; only that deprecation is silenced
+    warnings.filterwarnings('ignore', message=r'\s*Passing `palette` without assigning `hue`', category=FutureWarning)
+
+    workers = {}
+    if args.workers:
+        workers = {'ingest_workers': args.workers, 'cluster_workers': args.workers, 'forecast_workers': args.workers}
+    manifest = run_batch(
+        args.data, args.out, args.chunk_rows, args.incremental,
+        figures=not args.no_figures, keep=args.keep, **workers,
+    )
+    size = sum(f['bytes'] for f in manifest['files'].values())
+    print(f"Published {manifest['version']} to {args.out}: {len(manifest['files'])} files, {size / 1024 / 1024:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares two benchmark result files (JSON lines from benchmarks/run.py).
+
+Measurements are matched on (stage, rows); when a file holds several runs of the same pair the fastest
+is used. Exits with status 1 if any stage got slower than the threshold ratio.
+
+Usage:
+    python -m benchmarks.compare base.jsonl head.jsonl --threshold 1.10
+"""
+import argparse
+import json
+import sys
+
+
+def load_results(path):
+    """Returns {(stage, rows): best record} from a JSON-lines results file."""
+    best = {}
+    with open(path) as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            key = (record['stage'], record['rows'])
+            if key not in best or record['seconds'] < best[key]['seconds']:
+                best[key] = record
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument('base')
+    parser.add_argument('head')
+    parser.add_argument('--threshold', type=float, default=1.10, help="Slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    base, head = load_results(args.base), load_results(args.head)
+    regressions = 0
+    print(f"{'stage':<28} {'rows':>14} {'base s':>9} {'head s':>9} {'ratio':>7} {'base MB':>9} {'head MB':>9}")
+    for key in sorted(base.keys() & head.keys()):
+        old, new = base[key], head[key]
+        ratio = new['seconds'] / old['seconds'] if old['seconds'] > 0 else float('inf')
+        flag = '  REGRESSION' if ratio > args.threshold else ''
+        regressions += bool(flag)
+        print(f"{key[0]:<28} {key[1]:>14,} {old['seconds']:9.3f} {new['seconds']:9.3f} {ratio:7.2f} "
+              f"{old['peak_alloc_mb']:9.1f} {new['peak_alloc_mb']:9.1f}{flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
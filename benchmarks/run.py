@@ -0,0 +1,257 @@
+"""
+Benchmark suite for the dashboard pipeline.
+
+Each stage runs against synthetic data (see benchmarks/synthetic.py) and is timed and memory-profiled:
+wall seconds, peak Python/NumPy allocation during the stage (tracemalloc) and process RSS afterwards.
+Every measurement is written as one JSON line tagged with the git commit, so results from two commits
+can be compared with benchmarks/compare.py.
+
+Stages:
+    aggregate        chunked (Date, Domain, Location) aggregation and value sketching of the generated rows
+    ingest_csv       the same through read_csv (only with --csv-dir; the CSV is written once and reused)
+    ingest_parallel  the CSV aggregated on the partitioned process pool (--ingest-workers, only with --csv-dir)
+    summaries        domain / regional / monthly / daily / Domain-City summaries from the aggregate state
+    cube             building the Domain x Location x Day cube and every roll-up from it
+    rank             building the top-K rank arrays of the regional and Domain-City tables
+    forecast         fitting Holt-Winters models for every Domain-City pair series (--forecast-workers)
+    anomalies        rolling median / MAD scan of every Domain-City pair-day, then of one appended day
+    model_select     K-Means over the K range and seeds (elbow and silhouette scores)
+    segment          K=3 Domain-City segmentation
+    plot_*           rendering and PNG-encoding of each dashboard figure
+
+Usage (from the repository root):
+    python -m benchmarks.run --rows 1000000 10000000 --out bench.jsonl
+    python -m benchmarks.run --rows 1000000000 --stages aggregate summaries
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+
+from anomalies import scan
+from benchmarks.synthetic import iter_chunks, write_csv
+from config import CLUSTER_K_MAX, CLUSTER_SEEDS, CLUSTER_WORKERS, FORECAST_WORKERS, INGEST_WORKERS
+from cube import Cube
+from figure_cache import FigureCache
+from forecasting import fit_cube
+from ingestion import aggregate_chunk, combine_partials, state_from_partial, stream_state, summaries_from_state
+from parallel_ingest import parallel_state
+from profiling import current_rss_mb
+from ranking import RANK_KEYS, RANK_METRICS, RankIndex, top_k
+from shared_cache import SharedCache
+from sketches import merge_sketches, value_sketches
+
+PLOT_STAGES = ['plot_top_10_regional', 'plot_temporal_trends', 'plot_domain_location_matrix', 'plot_clustering_scores']
+STAGES = ['aggregate', 'ingest_csv', 'ingest_parallel', 'summaries', 'cube', 'rank', 'forecast', 'anomalies', 'model_select', 'segment'] + PLOT_STAGES
+
+
+def git_commit():
+    """Returns (commit hash, dirty flag) of the working tree, or (None, None) outside a git checkout."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+
+@contextmanager
+def measure(result):
+    """Times the enclosed block and fills `result` with seconds, peak traced allocation and RSS."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result['seconds'] = time.perf_counter() - start
+        result['peak_alloc_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+        result['rss_mb'] = current_rss_mb()
+
+
+def bench_aggregate(rows, chunk_rows, seed):
+    """Aggregates generated chunks; generation time is reported separately from aggregation time."""
+    result = {}
+    generate_seconds = 0.0
+    running = None
+    values = None
+    with measure(result):
+        chunks = iter_chunks(rows, chunk_rows, seed)
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            generate_seconds += time.perf_counter() - start
+            if chunk is None:
+                break
+            running = combine_partials([running, aggregate_chunk(chunk)])
+            values = merge_sketches([values, value_sketches(chunk)])
+            del chunk
+        state = state_from_partial(combine_partials([running]), values)
+    result['generate_seconds'] = generate_seconds
+    result['seconds'] -= generate_seconds
+    result['rows_per_sec'] = rows / result['seconds'] if result['seconds'] > 0 else 0.0
+    return result, state
+
+
+def synthetic_csv(rows, chunk_rows, seed, csv_dir):
+    """Returns the path of the synthetic CSV for these parameters, writing it on first use."""
+    path = os.path.join(csv_dir, f"synthetic-{rows}-s{seed}.csv")
+    if not os.path.exists(path):
+        write_csv(path, rows, chunk_rows, seed)
+    return path
+
+
+def bench_ingest_csv(path, chunk_rows, workers=1):
+    """Streams a synthetic CSV through read_csv, in one pass or on the partitioned process pool."""
+    result = {}
+    with measure(result):
+        if workers == 1:
+            _, stats = stream_state(path, chunk_rows)
+        else:
+            _, stats = parallel_state(path, chunk_rows, workers)
+    result['rows_per_sec'] = stats['rows_per_sec']
+    result['workers'] = stats.get('workers', 1)
+    result['file_mb'] = os.path.getsize(path) / 1024 / 1024
+    return result
+
+
+def bench_plot(plot_fn, *frames):
+    """Renders and encodes one figure, exactly as a figure-cache miss does in the dashboard."""
+    result = {}
+    with measure(result):
+        payload = FigureCache(SharedCache(max_bytes=0)).render(plot_fn, *frames)
+    result['bytes'] = len(payload)
+    return result
+
+
+def run_suite(rows, chunk_rows, seed, stages, csv_dir=None, workers=None, ingest_workers=None, forecast_workers=None):
+    """Runs the selected stages for one row count and yields (stage, result) pairs."""
+    result, state = bench_aggregate(rows, chunk_rows, seed)
+    if 'aggregate' in stages:
+        yield 'aggregate', result
+
+    if csv_dir and {'ingest_csv', 'ingest_parallel'} & set(stages):
+        path = synthetic_csv(rows, chunk_rows, seed, csv_dir)
+        if 'ingest_csv' in stages:
+            yield 'ingest_csv', bench_ingest_csv(path, chunk_rows)
+        if 'ingest_parallel' in stages:
+            yield 'ingest_parallel', bench_ingest_csv(path, chunk_rows, ingest_workers)
+
+    result = {}
+    with measure(result):
+        summaries = summaries_from_state(state)
+    if 'summaries' in stages:
+        yield 'summaries', result
+
+    if {'cube', 'forecast', 'anomalies'} & set(stages):
+        result = {}
+        with measure(result):
+            cube = Cube.from_cells(summaries['cells'])
+            cube.summaries()
+        if 'cube' in stages:
+            yield 'cube', result
+
+    if 'forecast' in stages:
+        result = {}
+        with measure(result):
+            models = fit_cube(cube, forecast_workers)
+        result['series'] = int(models['pairs'].sum()) * 2
+        yield 'forecast', result
+
+    if 'anomalies' in stages:
+        result = {}
+        with measure(result):
+            previous = scan(cube.select(end=cube.dates[-2]))
+        append = {}
+        with measure(append):
+            scan(cube, previous=previous)
+        result['append_seconds'] = append['seconds']
+        yield 'anomalies', result
+
+    result = {}
+    with measure(result):
+        ranks = {name: RankIndex.build(summaries[name], RANK_METRICS[name], RANK_KEYS[name]) for name in RANK_METRICS}
+    if 'rank' in stages:
+        yield 'rank', result
+
+    if not {'model_select', 'segment', 'plot_clustering_scores'} & set(stages):
+        scores = None
+    else:
+        # scikit-learn is only needed for the clustering stages
+        from clustering import evaluate_k_range, feature_matrix, fit_segments
+        result = {}
+        with measure(result):
+            scores = evaluate_k_range(feature_matrix(summaries['dc']), CLUSTER_K_MAX, CLUSTER_SEEDS, workers)
+        if 'model_select' in stages:
+            yield 'model_select', result
+        if 'segment' in stages:
+            result = {}
+            with measure(result):
+                fit_segments(summaries['dc'])
+            yield 'segment', result
+
+    if not set(PLOT_STAGES) & set(stages):
+        return
+    # Import matplotlib and seaborn up front so the plot stages time rendering, not module import
+    import matplotlib.pyplot  # noqa: F401
+    import seaborn  # noqa: F401
+    import plots
+    plot_inputs = {
+        'plot_top_10_regional': tuple(
+            top_k(summaries['regional_perf'], ranks['regional_perf'], metric) for metric in ['total_value', 'total_transactions']
+        ),
+        'plot_temporal_trends': (summaries['monthly_summary'], summaries['daily_summary']),
+        'plot_domain_location_matrix': (summaries['dc'],),
+        'plot_clustering_scores': (scores, scores.dropna(subset=['Score'])) if scores is not None else None,
+    }
+    for name in PLOT_STAGES:
+        if name in stages:
+            yield name, bench_plot(getattr(plots, name), *plot_inputs[name])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time and memory-profile each pipeline stage on synthetic data.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000], help="Row counts to benchmark (up to 10^9)")
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000, help="Rows per generated / read chunk")
+    parser.add_argument('--seed', type=int, default=0, help="Generator seed")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help="Stages to run (default: all)")
+    parser.add_argument('--csv-dir', help="Directory for synthetic CSVs; enables the ingest_csv stage")
+    parser.add_argument('--workers', type=int, default=CLUSTER_WORKERS, help="Processes for K-Means model selection")
+    parser.add_argument('--ingest-workers', type=int, default=INGEST_WORKERS, help="Processes for the ingest_parallel stage")
+    parser.add_argument('--forecast-workers', type=int, default=FORECAST_WORKERS, help="Processes for the forecast stage")
+    parser.add_argument('--out', help="Append JSON lines to this file instead of stdout")
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore')
+
+    commit, dirty = git_commit()
+    context = {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'chunk_rows': args.chunk_rows,
+        'seed': args.seed,
+    }
+    out = open(args.out, 'a') if args.out else sys.stdout
+    try:
+        for rows in args.rows:
+            for stage, result in run_suite(rows, args.chunk_rows, args.seed, args.stages, args.csv_dir, args.workers, args.ingest_workers, args.forecast_workers):
+                out.write(json.dumps({**context, 'rows': rows, 'stage': stage, **result}) + '\n')
+                out.flush()
+                print(f"{rows:>14,} {stage:<28} {result['seconds']:9.3f}s {result['peak_alloc_mb']:9.1f} MB peak alloc", file=sys.stderr)
+    finally:
+        if args.out:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Synthetic transaction generator shaped like the production file.
+
+Rows follow the raw schema (Date, Domain, Location, Value, Transaction_count) over the real 7 domains,
+46 locations and the 365 days of 2022, with per-row Value and Transaction_count drawn around the
+production means (~750,000 rupees and ~1,470 transactions). Data is produced in fixed-size chunks, each
+seeded from (seed, chunk index), so any row count up to 10^9 can be generated in bounded memory and the
+same seed and chunk size always give the same rows.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import reference_data
+
+DOMAINS = sorted(reference_data.domain_summary()['Domain'])
+LOCATIONS = sorted(reference_data.regional_perf()['Location'])
+DAYS = pd.date_range('2022-01-01', periods=365, freq='D').strftime('%Y-%m-%d')
+
+# Value is drawn in steps of 100 rupees, like the production file
+VALUE_STEPS = (5_000, 10_001)
+COUNT_RANGE = (1, 2_946)
+
+
+def generate_chunk(rows, seed=0, index=0):
+    """Returns one chunk of `rows` synthetic raw rows, deterministic in (seed, index)."""
+    rng = np.random.default_rng([seed, index])
+    return pd.DataFrame({
+        'Date': pd.Categorical.from_codes(rng.integers(0, len(DAYS), rows), categories=DAYS),
+        'Domain': pd.Categorical.from_codes(rng.integers(0, len(DOMAINS), rows), categories=DOMAINS),
+        'Location': pd.Categorical.from_codes(rng.integers(0, len(LOCATIONS), rows), categories=LOCATIONS),
+        'Value': (rng.integers(*VALUE_STEPS, rows) * 100).astype('float64'),
+        'Transaction_count': rng.integers(*COUNT_RANGE, rows),
+    })
+
+
+def iter_chunks(total_rows, chunk_rows=1_000_000, seed=0):
+    """Yields `total_rows` synthetic rows as chunks of at most `chunk_rows` rows."""
+    for index, start in enumerate(range(0, total_rows, chunk_rows)):
+        yield generate_chunk(min(chunk_rows, total_rows - start), seed, index)
+
+
+def write_csv(path, total_rows, chunk_rows=1_000_000, seed=0):
+    """Writes the synthetic rows to a CSV in the raw file layout, chunk by chunk."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    for index, chunk in enumerate(iter_chunks(total_rows, chunk_rows, seed)):
+        chunk.to_csv(tmp_path, mode='w' if index == 0 else 'a', header=index == 0, index=False)
+    os.replace(tmp_path, path)
+    return path
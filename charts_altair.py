@@ -0,0 +1,119 @@
+"""
+Vega-Lite (Altair) versions of the plot_* helpers.
+
+Each function takes the same inputs as its matplotlib counterpart but returns a chart spec. Only the
+rows and columns the chart needs are embedded, so the payload is a few KB of JSON and the browser does
+the drawing instead of the server rasterising a PNG per session and rerun.
+"""
+import altair as alt
+
+from ingestion import WEEKDAY_ORDER
+
+
+def _top10_bar(df, metric, title, scheme):
+    top10 = df[['Location', metric]]
+    return alt.Chart(top10, title=title).mark_bar().encode(
+        x=alt.X('Location:N', sort='-y', title=None, axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y(f'{metric}:Q', title=metric.replace('_', ' ').title(), axis=alt.Axis(format=',.0f')),
+        color=alt.Color('Location:N', sort='-y', scale=alt.Scale(scheme=scheme), legend=None),
+        tooltip=['Location', alt.Tooltip(f'{metric}:Q', format=',.0f')],
+    )
+
+
+def chart_top_10_regional(top10_value, top10_count):
+    """Top 10 locations by total value and total transactions."""
+    return alt.hconcat(
+        _top10_bar(top10_value, 'total_value', 'Top 10 Locations by Total Value (₹)', 'viridis'),
+        _top10_bar(top10_count, 'total_transactions', 'Top 10 Locations by Total Transactions (Volume)', 'magma'),
+    )
+
+
+def chart_temporal_trends(monthly_df, daily_df):
+    """Monthly and weekday transaction trends."""
+    monthly = monthly_df[['Month', 'total_value', 'total_transactions']]
+    daily = daily_df[['dayofweek', 'total_value', 'total_transactions']].astype({'dayofweek': str})
+
+    def monthly_line(metric, title, color):
+        return alt.Chart(monthly, title=title).mark_line(point=True, color=color).encode(
+            x=alt.X('Month:O', title=None, axis=alt.Axis(labelAngle=-45)),
+            y=alt.Y(f'{metric}:Q', title=metric.replace('_', ' ').title(), scale=alt.Scale(zero=False)),
+            tooltip=['Month', alt.Tooltip(f'{metric}:Q', format=',.0f')],
+        )
+
+    def weekday_bar(metric, title, scheme):
+        return alt.Chart(daily, title=title).mark_bar().encode(
+            x=alt.X('dayofweek:N', sort=WEEKDAY_ORDER, title=None),
+            y=alt.Y(f'{metric}:Q', title=metric.replace('_', ' ').title()),
+            color=alt.Color('dayofweek:N', sort=WEEKDAY_ORDER, scale=alt.Scale(scheme=scheme), legend=None),
+            tooltip=['dayofweek', alt.Tooltip(f'{metric}:Q', format=',.0f')],
+        )
+
+    return alt.vconcat(
+        alt.hconcat(
+            monthly_line('total_value', 'Monthly Total Value Trend (Seasonality)', 'forestgreen'),
+            monthly_line('total_transactions', 'Monthly Total Transactions Trend (Volume)', 'darkorange'),
+        ),
+        alt.hconcat(
+            weekday_bar('total_value', 'Daily Total Value Trend (Weekday vs. Weekend)', 'blues'),
+            weekday_bar('total_transactions', 'Daily Total Transactions Trend (Volume)', 'reds'),
+        ),
+    )
+
+
+def chart_forecast(monthly_df, value_forecast, count_forecast):
+    """Monthly totals followed by the next-quarter forecast and its 95% band."""
+    def forecast_layer(metric, forecast_df, title, color):
+        actual = monthly_df[['Month', metric]].astype({'Month': str}).rename(columns={metric: 'forecast'})
+        months = list(actual['Month']) + list(forecast_df['Month'])
+        x = alt.X('Month:O', sort=months, title=None, axis=alt.Axis(labelAngle=-45))
+        y_title = metric.replace('_', ' ').title()
+        band = alt.Chart(forecast_df).mark_area(opacity=0.2, color=color).encode(
+            x=x, y=alt.Y('lower:Q', title=y_title, scale=alt.Scale(zero=False)), y2='upper:Q',
+        )
+        history = alt.Chart(actual).mark_line(point=True, color=color).encode(
+            x=x, y='forecast:Q', tooltip=['Month', alt.Tooltip('forecast:Q', title=y_title, format=',.0f')],
+        )
+        predicted = alt.Chart(forecast_df).mark_line(point=True, color=color, strokeDash=[6, 4]).encode(
+            x=x, y='forecast:Q',
+            tooltip=['Month'] + [alt.Tooltip(f'{col}:Q', format=',.0f') for col in ('forecast', 'lower', 'upper')],
+        )
+        return alt.layer(band, history, predicted, title=title)
+
+    return alt.hconcat(
+        forecast_layer('total_value', value_forecast, 'Monthly Total Value with Next-Quarter Forecast', 'forestgreen'),
+        forecast_layer('total_transactions', count_forecast, 'Monthly Total Transactions with Next-Quarter Forecast', 'darkorange'),
+    )
+
+
+def chart_domain_location_matrix(df):
+    """Heatmap of Total Value by Domain and Location."""
+    cells = df.groupby(['Location', 'Domain'], observed=True, as_index=False)['total_value'].sum()
+    return alt.Chart(cells, title='Domain-Location Performance Matrix (Total Value)').mark_rect().encode(
+        x=alt.X('Domain:N', title='Domain'),
+        y=alt.Y('Location:N', title='Location'),
+        color=alt.Color('total_value:Q', scale=alt.Scale(scheme='yellowgreenblue'), title='Total Value'),
+        tooltip=['Domain', 'Location', alt.Tooltip('total_value:Q', format=',.0f')],
+    ).properties(height=900)
+
+
+def chart_clustering_scores(elbow_df, silhouette_df):
+    """Elbow chart and silhouette score trend."""
+    best_k = int(silhouette_df.loc[silhouette_df['Score'].idxmax(), 'K'])
+
+    elbow = alt.Chart(elbow_df[['K', 'Inertia']], title='Elbow Method (Inertia)').mark_line(point=True, color='blue').encode(
+        x=alt.X('K:O', title='Number of Clusters (K)'),
+        y=alt.Y('Inertia:Q'),
+        tooltip=['K', alt.Tooltip('Inertia:Q', format=',.1f')],
+    )
+    elbow_rule = alt.Chart(alt.Data(values=[{'K': 3}])).mark_rule(color='red', strokeDash=[6, 4]).encode(x='K:O')
+
+    silhouette = alt.Chart(silhouette_df[['K', 'Score']], title='Silhouette Score Analysis').mark_line(point=True, color='purple').encode(
+        x=alt.X('K:O', title='Number of Clusters (K)'),
+        y=alt.Y('Score:Q', title='Silhouette Score', scale=alt.Scale(zero=False)),
+        tooltip=['K', alt.Tooltip('Score:Q', format='.3f')],
+    )
+    silhouette_rules = alt.Chart(alt.Data(values=[{'K': best_k, 'c': 'green'}, {'K': 3, 'c': 'red'}])).mark_rule(strokeDash=[2, 2]).encode(
+        x='K:O', color=alt.Color('c:N', scale=None),
+    )
+
+    return alt.hconcat(elbow + elbow_rule, silhouette + silhouette_rules)
@@ -0,0 +1,396 @@
+"""
+K-Means clustering of Domain-City performance.
+
+Model selection: the features are standardised, K-Means is fitted for every k in 1..k_max with several
+seeds per k on a process pool, and the best seed per k supplies the inertia (elbow) and silhouette curves.
+Results are cached on disk by a hash of the feature matrix, so reruns on unchanged data are instant.
+
+Segmentation: the selected k=3 model names its centroids HIGH/MEDIUM/LOW by centroid total_value, and a
+refit is matched to the previous model's centroids (Hungarian assignment) so cluster IDs and labels stay
+stable across refreshes. Saved centroids can score new pairs without refitting.
+
+Feature store: the pair features, the fitted scaler, the centroids and every pair's cluster are kept in
+one memory-mapped binary file (see feature_store.py). Model-selection workers open it by path instead
+of each receiving a pickled copy of the matrix, and unchanged data with an unchanged model reuses its
+stored assignments instead of rescoring.
+
+Fine-grain mode: Domain x Location x Day rows (tens of millions of points) are clustered with
+MiniBatchKMeans fed from a chunked feature generator. The raw file is reduced to its pair-day cells in
+one chunked pass (in any row order), so memory depends on the chunk size and the number of cells,
+never on the file size.
+Silhouette is estimated on a bounded random sample because the exact score is O(n^2).
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+from sklearn.preprocessing import StandardScaler
+
+from aggregate_cache import read_frames, write_frames
+from feature_store import open_feature_store, write_feature_store
+from ingestion import aggregate_chunk, combine_partials, read_chunks
+from schema import LABEL_ORDER, label_dtype
+
+FEATURE_COLUMNS = ['avg_daily_value', 'avg_daily_count', 'total_value', 'total_transactions']
+PAIR_DAY_FEATURES = ['total_value', 'total_transactions', 'avg_txn_value', 'avg_txn_count']
+SEGMENT_MODEL_FILE = 'segment_model.json'
+FEATURE_STORE_FILE = 'pair_features.bin'
+# Unscored store for model-selection workers, so it never replaces the scored one
+SELECTION_STORE_FILE = 'pair_features.selection.bin'
+
+
+def feature_matrix(dc):
+    """Returns the clustering features of the Domain-City frame as a float64 array."""
+    return dc[FEATURE_COLUMNS].to_numpy(dtype='float64')
+
+
+def feature_hash(features):
+    """Hashes a feature matrix by shape and contents."""
+    digest = hashlib.sha256(str(features.shape).encode())
+    digest.update(np.ascontiguousarray(features).tobytes())
+    return digest.hexdigest()[:32]
+
+
+def scale_features(features):
+    """Standardises the features and returns (scaled, fitted scaler)."""
+    scaler = StandardScaler()
+    return scaler.fit_transform(features), scaler
+
+
+def _fit_one(scaled, k, seed):
+    """
+    Fits a single K-Means model; runs inside the worker processes.
+    `scaled` may be a feature store path, whose features the worker maps and standardises itself.
+    """
+    start = time.perf_counter()
+    if isinstance(scaled, str):
+        scaled, _ = scale_features(open_feature_store(scaled).matrix())
+    model = KMeans(n_clusters=k, random_state=seed, n_init=1).fit(scaled)
+    score = silhouette_score(scaled, model.labels_) if 1 < k < len(scaled) else np.nan
+    return k, seed, model.inertia_, score, time.perf_counter() - start
+
+
+def evaluate_k_range(features, k_max=9, n_seeds=3, workers=None, store_path=None):
+    """
+    Fits K-Means for k = 1..k_max with `n_seeds` seeds each and returns one row per k:
+    K, Inertia and Score (silhouette) of the lowest-inertia seed, Fit_Seconds (mean per fit) and Seeds.
+    `workers=1` fits serially in this process; otherwise workers read `store_path` (a feature store of
+    `features`) when given, instead of being sent the scaled matrix with every job.
+    """
+    scaled, _ = scale_features(features)
+    k_max = min(k_max, len(scaled))
+    jobs = [(k, seed) for k in range(1, k_max + 1) for seed in range(n_seeds)]
+
+    if workers == 1:
+        fits = [_fit_one(scaled, k, seed) for k, seed in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fits = list(pool.map(_fit_one, [store_path or scaled] * len(jobs), *zip(*jobs)))
+
+    fits = pd.DataFrame(fits, columns=['K', 'Seed', 'Inertia', 'Score', 'Fit_Seconds'])
+    best = fits.loc[fits.groupby('K')['Inertia'].idxmin(), ['K', 'Seed', 'Inertia', 'Score']]
+    timing = fits.groupby('K')['Fit_Seconds'].mean()
+    best['Fit_Seconds'] = best['K'].map(timing)
+    best['Seeds'] = n_seeds
+    return best.reset_index(drop=True)
+
+
+def model_selection(dc, cache_dir, k_max=9, n_seeds=3, workers=None):
+    """
+    Returns (scores, stats) for the Domain-City frame, served from the on-disk cache when the feature
+    matrix and parameters are unchanged. `stats` holds the wall time and whether the cache was hit.
+    """
+    features = feature_matrix(dc)
+    digest = feature_hash(features)
+    key = f"kmeans-{digest}-k{k_max}-s{n_seeds}"
+    frames, meta = read_frames(cache_dir, key)
+    if frames is not None:
+        return frames['scores'], {**meta['stats'], 'cache': 'hit'}
+
+    start = time.perf_counter()
+    store_path = None
+    if workers != 1:
+        store_path = _selection_store(dc, cache_dir, digest)
+    scores = evaluate_k_range(features, k_max=k_max, n_seeds=n_seeds, workers=workers, store_path=store_path)
+    stats = {'seconds': time.perf_counter() - start, 'fits': k_max * n_seeds, 'rows': len(features)}
+    write_frames(cache_dir, key, {'scores': scores}, meta={'stats': stats})
+    return scores, {**stats, 'cache': 'miss'}
+
+
+def _selection_store(dc, cache_dir, digest):
+    """Path of a feature store holding dc's features: the scored store when it is current, else the selection store."""
+    for name in (FEATURE_STORE_FILE, SELECTION_STORE_FILE):
+        store = open_feature_store(os.path.join(cache_dir, name))
+        if store is not None and store.feature_hash == digest:
+            return store.path
+    path = os.path.join(cache_dir, SELECTION_STORE_FILE)
+    write_pair_store(path, dc)
+    return path
+
+
+# --- SEGMENTATION: DETERMINISTIC LABELS AND STABLE ASSIGNMENT ---
+
+def match_centroids(previous, current):
+    """
+    Returns `order` such that current[order[i]] is the centroid closest to previous[i]
+    (Hungarian assignment on squared Euclidean distance).
+    """
+    cost = ((previous[:, None, :] - current[None, :, :]) ** 2).sum(axis=2)
+    rows, cols = linear_sum_assignment(cost)
+    return cols[np.argsort(rows)]
+
+
+def fit_segments(dc, k=3, seed=42, previous=None):
+    """
+    Fits K-Means on the Domain-City features and returns a segment model (a JSON-serialisable dict).
+    Without a previous model, cluster IDs are ordered by descending centroid total_value and named
+    HIGH/MEDIUM/LOW. With one, new centroids are matched to the previous ones so IDs and labels carry over.
+    On the reference pairs the default seed reproduces every Cluster_Label of the reference segmentation;
+    its integer Cluster IDs differ, because IDs here follow centroid value (0 = HIGH) and not fit order.
+    """
+    features = feature_matrix(dc)
+    scaled, scaler = scale_features(features)
+    kmeans = KMeans(n_clusters=k, random_state=seed, n_init=10).fit(scaled)
+    centroids = scaler.inverse_transform(kmeans.cluster_centers_)
+
+    if previous is not None and previous['k'] == k and previous['features'] == FEATURE_COLUMNS:
+        # Compare in the new scaler's units so every feature weighs the same as in the fit
+        previous_scaled = scaler.transform(np.asarray(previous['centroids']))
+        order = match_centroids(previous_scaled, kmeans.cluster_centers_)
+        labels = list(previous['labels'])
+    else:
+        order = np.argsort(-centroids[:, FEATURE_COLUMNS.index('total_value')], kind='stable')
+        labels = rank_labels(centroids[order, FEATURE_COLUMNS.index('total_value')])
+
+    return {
+        'k': k,
+        'seed': seed,
+        'features': FEATURE_COLUMNS,
+        'scaler_mean': scaler.mean_.tolist(),
+        'scaler_scale': scaler.scale_.tolist(),
+        'centroids': centroids[order].tolist(),
+        'labels': labels,
+        'feature_hash': feature_hash(features),
+    }
+
+
+def score_pairs(dc, model):
+    """Assigns each pair to the nearest saved centroid (no refit) and sets Cluster / Cluster_Label."""
+    mean = np.asarray(model['scaler_mean'])
+    scale = np.asarray(model['scaler_scale'])
+    scaled = (dc[model['features']].to_numpy(dtype='float64') - mean) / scale
+    centroids = (np.asarray(model['centroids']) - mean) / scale
+    cluster = ((scaled[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    labels = np.asarray(model['labels'], dtype=object)[cluster]
+    return dc.assign(
+        Cluster=cluster,
+        Cluster_Label=pd.Categorical(labels, dtype=label_dtype(model['labels'])),
+    )
+
+
+def save_segment_model(model, cache_dir):
+    """Stores the segment model as JSON in the cache directory."""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{SEGMENT_MODEL_FILE}.", suffix='.tmp')
+    with os.fdopen(fd, 'w') as fh:
+        json.dump(model, fh, indent=2)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, os.path.join(cache_dir, SEGMENT_MODEL_FILE))
+
+
+def load_segment_model(cache_dir):
+    """Returns the stored segment model, or None if none has been saved."""
+    try:
+        with open(os.path.join(cache_dir, SEGMENT_MODEL_FILE)) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def write_pair_store(path, dc, model=None, clusters=None):
+    """
+    Writes the Domain-City features as a feature store, with the segment model's scaler, centroids and
+    each pair's cluster when a model is given (otherwise with a scaler fitted on the features).
+    """
+    features = feature_matrix(dc)
+    if model is None:
+        _, scaler = scale_features(features)
+        write_feature_store(path, dc, FEATURE_COLUMNS, scaler.mean_, scaler.scale_, feature_hash(features))
+        return
+    write_feature_store(
+        path, dc, model['features'], model['scaler_mean'], model['scaler_scale'], feature_hash(features),
+        centroids=model['centroids'], labels=model['labels'], clusters=clusters,
+        model_meta={'seed': model['seed'], 'feature_hash': model['feature_hash']},
+    )
+
+
+def segment_pairs(dc, cache_dir, refit=True):
+    """
+    Labels the Domain-City frame with stable clusters.
+    With `refit`, K-Means is refitted when the features changed and matched to the saved model;
+    otherwise pairs are scored against the saved centroids, which makes refreshes cheap.
+    When the feature store holds these features and this model, its stored assignments are used as they are.
+    """
+    digest = feature_hash(feature_matrix(dc))
+    previous = load_segment_model(cache_dir)
+    if previous is None or (refit and previous['feature_hash'] != digest):
+        model = fit_segments(dc, previous=previous)
+        save_segment_model(model, cache_dir)
+    else:
+        model = previous
+
+    store_path = os.path.join(cache_dir, FEATURE_STORE_FILE)
+    store = open_feature_store(store_path)
+    if store is not None and store.scored and store.feature_hash == digest and store.model() == model:
+        return dc.assign(Cluster=store.cluster, Cluster_Label=store.cluster_labels()), model
+    segmented = score_pairs(dc, model)
+    write_pair_store(store_path, dc, model, segmented['Cluster'])
+    return segmented, model
+
+
+# --- FINE-GRAIN (DOMAIN x LOCATION x DAY) MINI-BATCH CLUSTERING ---
+
+def rank_labels(centroid_values):
+    """Names clusters by descending centroid value: HIGH/MEDIUM/LOW for k=3, SEGMENT_1..k otherwise."""
+    ranks = np.argsort(np.argsort(-np.asarray(centroid_values)))
+    names = LABEL_ORDER if len(ranks) == len(LABEL_ORDER) else [f"SEGMENT_{i + 1}" for i in range(len(ranks))]
+    return [names[rank] for rank in ranks]
+
+
+def _pair_day_frame(partial):
+    """Turns a (Date, Domain, Location) partial into pair-day feature rows."""
+    return pd.DataFrame({
+        'Date': partial['Date'].to_numpy(),
+        'Domain': partial['Domain'].to_numpy(),
+        'Location': partial['Location'].to_numpy(),
+        'total_value': partial['Value'].to_numpy(dtype='float64'),
+        'total_transactions': partial['Transaction_count'].to_numpy(dtype='float64'),
+        'avg_txn_value': (partial['Value'] / partial['rows']).to_numpy(),
+        'avg_txn_count': (partial['Transaction_count'] / partial['rows']).to_numpy(),
+    })
+
+
+def pair_day_cells(path, chunksize=1_000_000):
+    """
+    Reduces the raw file to one (Date, Domain, Location) cell per pair-day, sorted by date.
+    Chunk partials are merged as they are read, so rows may come in any order and every pair-day is a
+    single cell however its rows are spread over the file.
+    """
+    cells = None
+    for chunk in read_chunks(path, chunksize):
+        cells = combine_partials([cells, aggregate_chunk(chunk)])
+    return combine_partials([cells])
+
+
+def iter_pair_day_features(cells, chunksize=1_000_000):
+    """Yields pair-day feature frames of at most `chunksize` rows from pair_day_cells."""
+    for start in range(0, len(cells), chunksize):
+        yield _pair_day_frame(cells.iloc[start:start + chunksize])
+
+
+def fit_minibatch(make_chunks, k=3, features=PAIR_DAY_FEATURES, batch_size=4096, n_epochs=1, seed=0):
+    """
+    Fits a StandardScaler and a MiniBatchKMeans model over a chunked feature source.
+    `make_chunks` is a zero-argument callable returning a fresh iterator of feature frames, since the
+    scaler and the model each need a pass over the data.
+    """
+    scaler = StandardScaler()
+    for chunk in make_chunks():
+        scaler.partial_fit(chunk[features].to_numpy(dtype='float64'))
+
+    model = MiniBatchKMeans(n_clusters=k, batch_size=batch_size, random_state=seed, n_init=3)
+    for _ in range(n_epochs):
+        for chunk in make_chunks():
+            scaled = scaler.transform(chunk[features].to_numpy(dtype='float64'))
+            for start in range(0, len(scaled), batch_size):
+                batch = scaled[start:start + batch_size]
+                # The first partial_fit call needs at least k points to initialise the centroids
+                if len(batch) >= k or hasattr(model, 'cluster_centers_'):
+                    model.partial_fit(batch)
+    return scaler, model
+
+
+def sampled_silhouette(make_chunks, scaler, model, features=PAIR_DAY_FEATURES, sample_size=20000, seed=0):
+    """
+    Estimates the silhouette score on a uniform random sample of at most `sample_size` rows.
+    The sample is drawn in one pass by keeping the rows with the smallest random priorities.
+    """
+    rng = np.random.default_rng(seed)
+    sample = np.empty((0, len(features)))
+    priorities = np.empty(0)
+    for chunk in make_chunks():
+        scaled = scaler.transform(chunk[features].to_numpy(dtype='float64'))
+        sample = np.vstack([sample, scaled])
+        priorities = np.concatenate([priorities, rng.random(len(scaled))])
+        if len(sample) > sample_size:
+            keep = np.argpartition(priorities, sample_size)[:sample_size]
+            sample, priorities = sample[keep], priorities[keep]
+
+    labels = model.predict(sample)
+    if len(np.unique(labels)) < 2:
+        return np.nan, len(sample)
+    return silhouette_score(sample, labels), len(sample)
+
+
+def assign_clusters(chunk, scaler, model, labels, features=PAIR_DAY_FEATURES):
+    """Adds the Cluster and Cluster_Label columns Section 6 consumes to a feature frame."""
+    cluster = model.predict(scaler.transform(chunk[features].to_numpy(dtype='float64')))
+    return chunk.assign(Cluster=cluster, Cluster_Label=np.asarray(labels, dtype=object)[cluster])
+
+
+def cluster_pair_days(path, out_path, chunksize=1_000_000, k=3, sample_size=20000, seed=0):
+    """
+    Clusters every Domain x Location x Day row of the raw file with bounded memory.
+    The file is read once; the scaler, model, silhouette and assignment passes iterate over its cells.
+    Assignments are streamed to an Arrow file at `out_path`; returns (profile, stats) where `profile`
+    has the same per-Cluster_Label shape as the Section 6 cluster summary.
+    """
+    start = time.perf_counter()
+    cells = pair_day_cells(path, chunksize)
+
+    def make_chunks():
+        return iter_pair_day_features(cells, chunksize)
+
+    scaler, model = fit_minibatch(make_chunks, k=k, seed=seed)
+    centroids = scaler.inverse_transform(model.cluster_centers_)
+    labels = rank_labels(centroids[:, PAIR_DAY_FEATURES.index('total_value')])
+    score, sampled = sampled_silhouette(make_chunks, scaler, model, sample_size=sample_size, seed=seed)
+
+    profile_parts = []
+    points = 0
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    writer = None
+    with pa.OSFile(out_path, 'wb') as sink:
+        for chunk in make_chunks():
+            assigned = assign_clusters(chunk, scaler, model, labels)
+            points += len(assigned)
+            profile_parts.append(assigned.groupby('Cluster_Label').agg(
+                Points=('Location', 'size'), value_sum=('total_value', 'sum')
+            ))
+            table = pa.Table.from_pandas(assigned, preserve_index=False)
+            if writer is None:
+                writer = pa.ipc.new_file(sink, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+
+    profile = pd.concat(profile_parts).groupby(level=0).sum()
+    profile['Avg_Daily_Value_Mean'] = profile.pop('value_sum') / profile['Points']
+    profile = profile.reset_index().sort_values('Avg_Daily_Value_Mean', ascending=False, ignore_index=True)
+    stats = {
+        'points': points,
+        'silhouette': score,
+        'silhouette_sample': sampled,
+        'seconds': time.perf_counter() - start,
+    }
+    return profile, stats
@@ -0,0 +1,64 @@
+"""
+Runtime configuration for the REC-SSEC dashboard.
+Every setting can be overridden with an environment variable so the same code runs locally and in deployment.
+"""
+import os
+
+# Raw transaction file (CSV with Date, Domain, Location, Value, Transaction_count).
+# When empty, the dashboard falls back to the hardcoded reference tables.
+DATA_PATH = os.environ.get('REC_SSEC_DATA_PATH', '')
+
+# Rows read per chunk while streaming the raw file (bounds peak memory)
+CHUNK_SIZE = int(os.environ.get('REC_SSEC_CHUNK_SIZE', '1000000'))
+
+# Processes aggregating partitions of the raw file (0 = one per CPU, 1 = single process)
+INGEST_WORKERS = int(os.environ.get('REC_SSEC_INGEST_WORKERS', '0')) or None
+
+# Serve summaries from the incrementally maintained aggregate state (see incremental.py)
+INCREMENTAL = os.environ.get('REC_SSEC_INCREMENTAL', '0') == '1'
+
+# K-Means model selection: largest k, seeds per k and worker processes (0 = one per CPU)
+CLUSTER_K_MAX = int(os.environ.get('REC_SSEC_CLUSTER_K_MAX', '9'))
+CLUSTER_SEEDS = int(os.environ.get('REC_SSEC_CLUSTER_SEEDS', '3'))
+CLUSTER_WORKERS = int(os.environ.get('REC_SSEC_CLUSTER_WORKERS', '0')) or None
+
+# Refit the k=3 segmentation when features change (1), or only score pairs against the saved centroids (0)
+CLUSTER_REFIT = os.environ.get('REC_SSEC_CLUSTER_REFIT', '1') == '1'
+
+# Clustering grain: 'pair' (Domain x Location) or 'pair_day' (adds mini-batch clustering of Domain x Location x Day rows)
+CLUSTER_GRAIN = os.environ.get('REC_SSEC_CLUSTER_GRAIN', 'pair')
+
+# Processes for fitting the per-pair forecasts (0 = one per CPU; inputs below forecasting.BLOCK_SERIES series fit in-process)
+FORECAST_WORKERS = int(os.environ.get('REC_SSEC_FORECAST_WORKERS', '0')) or None
+
+# Anomaly scan: trailing window in days for the rolling median / MAD, and the robust |z| above which a pair-day is flagged
+ANOMALY_WINDOW = int(os.environ.get('REC_SSEC_ANOMALY_WINDOW', '28'))
+ANOMALY_THRESHOLD = float(os.environ.get('REC_SSEC_ANOMALY_THRESHOLD', '3.5'))
+
+# Chart backend: 'matplotlib' (server-rendered, cached images; also used for static export) or 'altair' (client-side Vega-Lite)
+CHART_BACKEND = os.environ.get('REC_SSEC_CHART_BACKEND', 'matplotlib')
+
+# Memoised filtered tables (one entry per table and filter combination)
+FILTER_CACHE_ITEMS = int(os.environ.get('REC_SSEC_FILTER_CACHE_ITEMS', '64'))
+
+# Process-wide cache of derived statistics and rendered figures shared by all sessions:
+# memory cap in MB, and whether entries are also kept on disk under CACHE_DIR/shared
+SHARED_CACHE_MB = int(os.environ.get('REC_SSEC_SHARED_CACHE_MB', '256'))
+SHARED_CACHE_DISK = os.environ.get('REC_SSEC_SHARED_CACHE_DISK', '1') == '1'
+
+# Cap in MB on the shared cache's disk tier; least recently used entries are removed beyond it
+SHARED_CACHE_DISK_MB = int(os.environ.get('REC_SSEC_SHARED_CACHE_DISK_MB', '1024'))
+
+# Rendered figure image format ('png' or 'svg')
+FIGURE_FORMAT = os.environ.get('REC_SSEC_FIGURE_FORMAT', 'png')
+
+# Profiling: show the (normally hidden) profiler panel, and append one JSON line per rerun to this file
+# The panel can also be opened per session with the ?profile=1 query parameter.
+PROFILE_PANEL = os.environ.get('REC_SSEC_PROFILE', '0') == '1'
+PROFILE_LOG = os.environ.get('REC_SSEC_PROFILE_LOG', '')
+
+# Versioned artifacts published by batch.py; when set and a version exists, the dashboard only reads them
+ARTIFACT_DIR = os.environ.get('REC_SSEC_ARTIFACT_DIR', '')
+
+# Directory for on-disk caches (computed aggregates and their source hashes)
+CACHE_DIR = os.environ.get('REC_SSEC_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
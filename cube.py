@@ -0,0 +1,163 @@
+"""
+Dense Domain x Location x Day cube of transaction value, transaction count and row count.
+
+The cube is built once from the (Date, Domain, Location) cells of the aggregate state: domains and
+locations are indexed by integer codes (sorted names) and days by their offset from the first date,
+so the full year is 7 x 46 x 365 cells per measure (about 1 MB each). Every summary the dashboard
+shows is an array reduction over that cube, and date-range / domain / location filters are index
+selections, so no query ever touches raw rows.
+
+`rollup` returns exactly the frames ingestion.summaries_from_state derives for the same cells.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from ingestion import WEEKDAY_ORDER
+
+ROLLUPS = ['domain_summary', 'regional_perf', 'monthly_summary', 'daily_summary', 'dc']
+
+
+def _sum_by(codes, values, n):
+    """Sums `values` into `n` groups given each element's group code."""
+    totals = np.zeros(n, dtype=values.dtype)
+    np.add.at(totals, codes, values)
+    return totals
+
+
+class Cube:
+    """Value / transaction / row arrays indexed [domain, location, day]."""
+
+    def __init__(self, domains, locations, dates, value, transactions, rows):
+        self.domains = domains
+        self.locations = locations
+        self.dates = dates
+        self.value = value
+        self.transactions = transactions
+        self.rows = rows
+
+    @classmethod
+    def from_cells(cls, cells):
+        """Builds the cube from a frame of Date, Domain, Location, Value, Transaction_count and rows."""
+        domains = np.sort(cells['Domain'].astype(str).unique())
+        locations = np.sort(cells['Location'].astype(str).unique())
+        dates = pd.date_range(cells['Date'].min(), cells['Date'].max(), freq='D')
+        index = (
+            pd.Categorical(cells['Domain'].astype(str), categories=domains).codes,
+            pd.Categorical(cells['Location'].astype(str), categories=locations).codes,
+            ((cells['Date'] - dates[0]) // pd.Timedelta(days=1)).to_numpy(),
+        )
+        shape = (len(domains), len(locations), len(dates))
+        measures = []
+        for column, dtype in (('Value', 'float64'), ('Transaction_count', 'int64'), ('rows', 'int64')):
+            array = np.zeros(shape, dtype=dtype)
+            np.add.at(array, index, cells[column].to_numpy(dtype=dtype))
+            measures.append(array)
+        return cls(domains, locations, dates, *measures)
+
+    @property
+    def nbytes(self):
+        """Memory held by the three measure arrays."""
+        return self.value.nbytes + self.transactions.nbytes + self.rows.nbytes
+
+    def content_hash(self):
+        """Hash of the names, dates and measures; keys models and scans derived from this cube."""
+        if getattr(self, '_content_hash', None) is None:
+            digest = hashlib.sha256()
+            for names in (self.domains, self.locations):
+                digest.update('\x1f'.join(map(str, names)).encode())
+            digest.update(str(self.dates[0]).encode())
+            for array in (self.value, self.transactions, self.rows):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def select(self, domains=None, locations=None, start=None, end=None):
+        """
+        Returns the sub-cube for the given domain and location names and the inclusive date range.
+        None leaves that axis unfiltered.
+        """
+        d = np.arange(len(self.domains)) if domains is None else np.flatnonzero(np.isin(self.domains, list(domains)))
+        l = np.arange(len(self.locations)) if locations is None else np.flatnonzero(np.isin(self.locations, list(locations)))
+        lo = 0 if start is None else int(self.dates.searchsorted(pd.Timestamp(start), side='left'))
+        hi = len(self.dates) if end is None else int(self.dates.searchsorted(pd.Timestamp(end), side='right'))
+        cells = np.ix_(d, l, np.arange(lo, hi))
+        return Cube(
+            self.domains[d], self.locations[l], self.dates[lo:hi],
+            self.value[cells], self.transactions[cells], self.rows[cells],
+        )
+
+    def rollup(self, name):
+        """Returns one dashboard summary frame ('domain_summary', 'regional_perf', 'monthly_summary', 'daily_summary' or 'dc')."""
+        recorded = self.rows > 0
+
+        if name == 'domain_summary':
+            rows = self.rows.sum(axis=(1, 2))
+            keep = rows > 0
+            days = recorded.any(axis=1).sum(axis=1)[keep]
+            value = self.value.sum(axis=(1, 2))[keep]
+            transactions = self.transactions.sum(axis=(1, 2))[keep]
+            frame = pd.DataFrame({
+                'Domain': self.domains[keep],
+                'avg_daily_value': value / days,
+                'avg_daily_count': transactions / days,
+                'total_value': value,
+                'total_transactions': transactions,
+                'days_recorded': days,
+            })
+            return frame.sort_values('total_value', ascending=False, ignore_index=True)
+
+        if name == 'regional_perf':
+            rows = self.rows.sum(axis=(0, 2))
+            keep = rows > 0
+            value = self.value.sum(axis=(0, 2))[keep]
+            transactions = self.transactions.sum(axis=(0, 2))[keep]
+            return pd.DataFrame({
+                'Location': self.locations[keep],
+                # Per-row means, as in summaries_from_state
+                'avg_txn_value': value / rows[keep],
+                'avg_txn_count': transactions / rows[keep],
+                'total_transactions': transactions,
+                'total_value': value,
+                'days_recorded': recorded.any(axis=0).sum(axis=1)[keep],
+            })
+
+        if name in ('monthly_summary', 'daily_summary'):
+            if name == 'monthly_summary':
+                labels = self.dates.to_period('M').astype(str)
+                key, order = 'Month', sorted(set(labels))
+            else:
+                labels = self.dates.day_name()
+                key, order = 'dayofweek', WEEKDAY_ORDER
+            codes = pd.Categorical(labels, categories=order).codes
+            keep = _sum_by(codes, self.rows.sum(axis=(0, 1)), len(order)) > 0
+            frame = pd.DataFrame({
+                key: np.asarray(order)[keep],
+                'total_value': _sum_by(codes, self.value.sum(axis=(0, 1)), len(order))[keep],
+                'total_transactions': _sum_by(codes, self.transactions.sum(axis=(0, 1)), len(order))[keep],
+            })
+            if key == 'dayofweek':
+                frame['dayofweek'] = pd.Categorical(frame['dayofweek'], categories=WEEKDAY_ORDER, ordered=True)
+            return frame
+
+        if name == 'dc':
+            keep = self.rows.sum(axis=2) > 0
+            days = recorded.sum(axis=2)[keep]
+            value = self.value.sum(axis=2)[keep]
+            transactions = self.transactions.sum(axis=2)[keep]
+            domain_idx, location_idx = np.nonzero(keep)
+            return pd.DataFrame({
+                'Domain': self.domains[domain_idx],
+                'Location': self.locations[location_idx],
+                'avg_daily_value': value / days,
+                'avg_daily_count': transactions / days,
+                'total_value': value,
+                'total_transactions': transactions,
+            })
+
+        raise KeyError(f"Unknown roll-up: {name}")
+
+    def summaries(self):
+        """Every dashboard summary frame, as a dict keyed like summaries_from_state."""
+        return {name: self.rollup(name) for name in ROLLUPS}
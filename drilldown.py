@@ -0,0 +1,55 @@
+"""
+Server-side sorting, search and pagination of the cluster result set.
+
+`build_sorted_index` groups the rank arrays of the pair table (ranking.RankIndex) by Cluster_Label once
+per segmentation, so no column is sorted again for the cluster tables. A page query then only takes those positions (reversed for ascending order), drops
+the rows hidden by the search text or the sidebar filters, and materialises the requested page, so
+nothing is sorted per rerun and only the visible rows are serialised to the browser.
+"""
+import numpy as np
+
+from ranking import RankIndex
+
+SORT_COLUMNS = ['total_value', 'total_transactions', 'avg_daily_value', 'avg_daily_count']
+SEARCH_COLUMNS = ['Domain', 'Location']
+
+
+def build_sorted_index(df, label_column='Cluster_Label', sort_columns=SORT_COLUMNS, ranks=None):
+    """
+    Returns {sort column: {label: row positions of that label in descending column order}}.
+    `ranks` is the RankIndex of the same rows (e.g. of the unsegmented pair table); it is built if not given.
+    """
+    if ranks is None:
+        ranks = RankIndex.build(df, sort_columns, SEARCH_COLUMNS)
+    return {column: ranks.by_group(column, df[label_column]) for column in sort_columns}
+
+
+def search_mask(df, text, columns=SEARCH_COLUMNS):
+    """Boolean array of rows whose Domain or Location contains `text` (case-insensitive)."""
+    text = text.strip().lower()
+    mask = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        values = df[column].astype('category')
+        # Only the distinct names are searched; rows are matched by their category code
+        hits = np.flatnonzero(values.cat.categories.astype(str).str.lower().str.contains(text, regex=False))
+        mask |= np.isin(values.cat.codes.to_numpy(), hits)
+    return mask
+
+
+def ordered_positions(index, label, sort_by='total_value', ascending=False, visible=None):
+    """
+    Row positions of one Cluster_Label in the requested order.
+    `visible` is an optional boolean array over the rows (search and filter matches).
+    """
+    positions = index[sort_by].get(label, np.array([], dtype=np.intp))
+    if ascending:
+        positions = positions[::-1]
+    if visible is not None:
+        positions = positions[visible[positions]]
+    return positions
+
+
+def page_of(df, positions, page=1, page_size=25):
+    """Materialises only the rows of page `page` (1-based)."""
+    start = (max(page, 1) - 1) * page_size
+    return df.iloc[positions[start:start + page_size]]
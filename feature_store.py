@@ -0,0 +1,218 @@
+"""
+Memory-mapped binary store of the Domain-City feature matrix and its segment model.
+
+One file holds a fixed-size header, a small UTF-8 JSON dictionary (code -> name for Domain, Location,
+the feature columns, the cluster labels and the model's scalar fields) and the arrays, each aligned to 64 bytes:
+
+    domain_code   int16   [pairs]
+    location_code int16   [pairs]
+    cluster       int8    [pairs]              assigned cluster per pair (-1 = not scored)
+    features      float64 [features, pairs]    column-major, so every feature column is contiguous
+    scaler_mean   float64 [features]
+    scaler_scale  float64 [features]
+    centroids     float64 [k, features]        in feature units (k = 0 when no model is stored)
+
+Readers map the file once with np.memmap and every array is a read-only view into that mapping, so
+opening the store copies nothing and processes that open the same file share its pages. Files are
+written under a unique temporary name and renamed into place, so concurrent writers (threads or
+processes) never touch each other's file and a reader keeps the version it mapped.
+"""
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from schema import label_dtype
+
+MAGIC = b'RSFSTORE'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+HEADER = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('pairs', '<u4'),
+    ('features', '<u4'),
+    ('k', '<u4'),
+    ('dictionary_bytes', '<u4'),
+    ('feature_hash', 'S32'),
+])
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _layout(header):
+    """[(name, dtype, shape, offset)] of the arrays described by `header`."""
+    n, f, k = int(header['pairs']), int(header['features']), int(header['k'])
+    arrays = [
+        ('domain_code', '<i2', (n,)),
+        ('location_code', '<i2', (n,)),
+        ('cluster', 'i1', (n,)),
+        ('features', '<f8', (f, n)),
+        ('scaler_mean', '<f8', (f,)),
+        ('scaler_scale', '<f8', (f,)),
+        ('centroids', '<f8', (k, f)),
+    ]
+    layout = []
+    offset = _aligned(HEADER.itemsize + int(header['dictionary_bytes']))
+    for name, dtype, shape in arrays:
+        layout.append((name, dtype, shape, offset))
+        offset = _aligned(offset + np.dtype(dtype).itemsize * int(np.prod(shape)))
+    return layout
+
+
+def _codes(values):
+    """(int16 codes, names) of a Domain or Location column; categorical columns keep their categories."""
+    categorical = values.astype('category')
+    return categorical.cat.codes.to_numpy(dtype='int16'), [str(name) for name in categorical.cat.categories]
+
+
+def write_feature_store(path, df, feature_columns, scaler_mean, scaler_scale, feature_hash,
+                        centroids=None, labels=None, clusters=None, model_meta=None):
+    """
+    Writes the Domain / Location codes and `feature_columns` of `df` (one row per pair), the fitted scaler
+    and, optionally, the centroids with their labels, each pair's cluster and the model's remaining
+    JSON-serialisable fields (`model_meta`, e.g. its seed).
+    """
+    domain_codes, domains = _codes(df['Domain'])
+    location_codes, locations = _codes(df['Location'])
+    centroids = np.zeros((0, len(feature_columns))) if centroids is None else np.asarray(centroids, dtype='float64')
+    dictionary = json.dumps({
+        'domains': domains, 'locations': locations,
+        'features': list(feature_columns), 'labels': [] if labels is None else list(labels),
+        'dtypes': [df[col].dtype.str for col in feature_columns],
+        'model': model_meta or {},
+    }).encode()
+
+    header = np.zeros((), dtype=HEADER)
+    header['magic'] = MAGIC
+    header['version'] = FORMAT_VERSION
+    header['pairs'] = len(df)
+    header['features'] = len(feature_columns)
+    header['k'] = len(centroids)
+    header['dictionary_bytes'] = len(dictionary)
+    header['feature_hash'] = feature_hash.encode()
+    arrays = {
+        'domain_code': domain_codes,
+        'location_code': location_codes,
+        'cluster': np.full(len(df), -1) if clusters is None else np.asarray(clusters),
+        'features': df[list(feature_columns)].to_numpy(dtype='float64').T,
+        'scaler_mean': np.asarray(scaler_mean),
+        'scaler_scale': np.asarray(scaler_scale),
+        'centroids': centroids,
+    }
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(header.tobytes())
+            fh.write(dictionary)
+            for name, dtype, shape, offset in _layout(header):
+                fh.write(b'\0' * (offset - fh.tell()))
+                fh.write(np.ascontiguousarray(arrays[name], dtype=dtype).reshape(shape).tobytes())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class FeatureStore:
+    """Read-only views into one memory-mapped feature store file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._map = np.memmap(path, dtype='uint8', mode='r')
+        header = self._map[:HEADER.itemsize].view(HEADER)[0]
+        if header['magic'] != MAGIC or header['version'] != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} feature store")
+        self.feature_hash = header['feature_hash'].decode()
+        dictionary = json.loads(bytes(self._map[HEADER.itemsize:HEADER.itemsize + int(header['dictionary_bytes'])]))
+        self.domains = np.asarray(dictionary['domains'], dtype=object)
+        self.locations = np.asarray(dictionary['locations'], dtype=object)
+        self.feature_columns = dictionary['features']
+        self.dtypes = dictionary['dtypes']
+        self.labels = dictionary['labels']
+        self.model_meta = dictionary['model']
+        for name, dtype, shape, offset in _layout(header):
+            size = np.dtype(dtype).itemsize * int(np.prod(shape))
+            # Plain ndarray views of the mapping (the memmap subclass would follow them into pickles)
+            setattr(self, name, np.asarray(self._map[offset:offset + size].view(dtype).reshape(shape)))
+
+    def __len__(self):
+        return len(self.domain_code)
+
+    @property
+    def scored(self):
+        """True if the store holds a segment model and every pair's cluster."""
+        return len(self.centroids) > 0 and bool((self.cluster >= 0).all())
+
+    def matrix(self):
+        """The features as a pairs x features view (no copy)."""
+        return self.features.T
+
+    def scaled(self):
+        """Standardised features, as the stored scaler transforms them."""
+        return (self.matrix() - self.scaler_mean) / self.scaler_scale
+
+    def model(self):
+        """The stored segment model in the layout of clustering.fit_segments, or None."""
+        if not len(self.centroids):
+            return None
+        return {
+            'k': len(self.centroids),
+            **self.model_meta,
+            'features': self.feature_columns,
+            'scaler_mean': self.scaler_mean.tolist(),
+            'scaler_scale': self.scaler_scale.tolist(),
+            'centroids': self.centroids.tolist(),
+            'labels': self.labels,
+        }
+
+    def cluster_labels(self):
+        """Each pair's cluster label as an ordered categorical."""
+        return pd.Categorical(np.asarray(self.labels, dtype=object)[self.cluster], dtype=label_dtype(self.labels))
+
+    def frame(self):
+        """
+        The pair table: Domain and Location categoricals decoded from their codes, the feature columns
+        (float64 ones are views into the mapping, others are cast back to the type they were written from)
+        and, when scored, Cluster / Cluster_Label.
+        """
+        columns = {
+            'Domain': pd.Categorical.from_codes(self.domain_code, categories=self.domains),
+            'Location': pd.Categorical.from_codes(self.location_code, categories=self.locations),
+        }
+        for col, dtype, values in zip(self.feature_columns, self.dtypes, self.features):
+            columns[col] = values if dtype == values.dtype.str else values.astype(dtype)
+        if self.scored:
+            columns['Cluster'] = self.cluster
+            columns['Cluster_Label'] = self.cluster_labels()
+        return pd.DataFrame(columns, copy=False)
+
+
+# {absolute path: (file version, FeatureStore)}
+_OPEN = {}
+
+
+def open_feature_store(path):
+    """
+    The FeatureStore at `path`, mapped once per process and file version, or None if there is no valid store.
+    Worker processes call this with the path instead of receiving pickled copies of the features.
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+        version = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached = _OPEN.get(path)
+        if cached is None or cached[0] != version:
+            cached = _OPEN[path] = (version, FeatureStore(path))
+        return cached[1]
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,78 @@
+"""
+Cache of rendered matplotlib figures.
+
+Figures are keyed by a hash of the input data, the plot parameters and the plotting function's source,
+and stored as encoded PNG/SVG bytes in the process-wide SharedCache (memory-capped LRU, optionally backed
+by disk). A cache hit serves the bytes directly without touching matplotlib; on a miss the figure is
+rendered once, encoded and closed so it does not accumulate in pyplot's global figure registry.
+"""
+import hashlib
+import inspect
+import io
+
+import pandas as pd
+
+import profiling
+
+
+def frame_hash(df):
+    """Hashes a DataFrame's contents, index and column names."""
+    digest = hashlib.sha256(','.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def figure_key(plot_fn, frames, params):
+    """Builds the cache key for one rendering of `plot_fn`."""
+    digest = hashlib.sha256(plot_fn.__name__.encode())
+    digest.update(inspect.getsource(plot_fn).encode())
+    for df in frames:
+        digest.update(frame_hash(df).encode())
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()[:32]
+
+
+class FigureCache:
+    """Encoded figures kept in a SharedCache (memory-capped LRU plus its optional disk tier)."""
+
+    def __init__(self, store, fmt='png', dpi=100):
+        self.store = store
+        self.fmt = fmt
+        self.dpi = dpi
+
+    def _store_key(self, key):
+        return f"figure:{self.fmt}:{self.dpi}:{key}"
+
+    def get(self, key):
+        """Returns the encoded figure for `key` from the store, or None."""
+        return self.store.get(self._store_key(key))
+
+    def add(self, key, payload):
+        """Stores an already encoded figure (e.g. pre-rendered by batch.py) under its figure_key."""
+        self.store.put(self._store_key(key), payload, persist=False)
+
+    def _encode(self, plot_fn, frames, params):
+        import matplotlib.pyplot as plt
+        with profiling.stage(f"render:{plot_fn.__name__}"):
+            fig = plot_fn(*frames, **params)
+            buffer = io.BytesIO()
+            try:
+                fig.savefig(buffer, format=self.fmt, dpi=self.dpi, bbox_inches='tight')
+            finally:
+                plt.close(fig)
+        return buffer.getvalue()
+
+    def render(self, plot_fn, *frames, **params):
+        """
+        Returns the encoded figure of plot_fn(*frames, **params), rendering it only on a cache miss.
+        Sessions asking for the same figure at the same time share one rendering.
+        """
+        rendered = []
+
+        def compute():
+            rendered.append(True)
+            return self._encode(plot_fn, frames, params)
+
+        payload = self.store.get_or_compute(self._store_key(figure_key(plot_fn, frames, params)), compute)
+        profiling.cache_event('figure', hit=not rendered)
+        return payload
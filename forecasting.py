@@ -0,0 +1,210 @@
+"""
+Batched daily forecasts for every Domain-City pair.
+
+Every pair's daily series (a column of a days x series matrix taken from the cube) is fitted with
+additive Holt-Winters exponential smoothing with a weekly season. The smoothing parameters are chosen
+per series from a small grid by one-step-ahead squared error; the grid points and the series are
+evaluated together as (grid, series) arrays, so the loop is over days only. Large series counts are
+split into blocks fitted on a process pool (`workers=1` fits every block in this process).
+
+Forecasts of a Domain, a Location or the total are sums of pair forecasts (bottom-up), so any sidebar
+selection of pairs has a consistent forecast. Prediction bands use the ETS(A,A,A) h-step variance per
+pair, scaled by how correlated the pairs' one-step errors were in the fitted history.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+# Bump when the model layout, the fitting or the forecast bands change, so cached models and forecasts from older code are recomputed
+VERSION = 2
+
+SEASON = 7
+ALPHAS = [0.05, 0.1, 0.2, 0.3, 0.5]
+BETAS = [0.0, 0.01, 0.05]
+GAMMAS = [0.05, 0.1, 0.3]
+# Series per process-pool job; smaller inputs are fitted in this process
+BLOCK_SERIES = 4096
+Z_95 = 1.96
+
+
+def _smooth(y, alpha, beta, gamma, season=SEASON, keep_errors=False):
+    """
+    Runs additive Holt-Winters over y (days x series) for parameter arrays broadcastable to (..., series).
+    Returns (sum of squared one-step errors, one-step errors (days x ...) or None, final level, trend, season).
+    The first two seasons initialise the state; their errors are excluded from the sum.
+    """
+    shape = np.broadcast_shapes(np.shape(alpha), y.shape[1:])
+    first, second = y[:season].mean(axis=0), y[season:2 * season].mean(axis=0)
+    level = np.broadcast_to(first, shape).copy()
+    trend = np.broadcast_to((second - first) / season, shape).copy()
+    seasonal = np.broadcast_to((y[:season] - first)[:, None] if len(shape) > 1 else y[:season] - first,
+                               (season,) + shape).copy()
+    errors = np.empty((len(y),) + shape) if keep_errors else None
+    sse = np.zeros(shape)
+    for t in range(len(y)):
+        s = seasonal[t % season]
+        error = y[t] - (level + trend + s)
+        if t >= 2 * season:
+            sse += error ** 2
+        if keep_errors:
+            errors[t] = error
+        new_level = alpha * (y[t] - s) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        seasonal[t % season] = gamma * (y[t] - new_level) + (1 - gamma) * s
+        level = new_level
+    return sse, errors, level, trend, seasonal
+
+
+def fit_block(y, season=SEASON):
+    """Fits one block of series (days x series); returns the model arrays for those series. Runs in the workers."""
+    grid = np.array(list(product(ALPHAS, BETAS, GAMMAS)))
+    alpha, beta, gamma = (grid[:, i, None] for i in range(3))
+    sse, _, _, _, _ = _smooth(y, alpha, beta, gamma, season)
+    best = grid[sse.argmin(axis=0)]
+    # Second pass with each series' own parameters, for its residuals and final state
+    _, errors, level, trend, seasonal = _smooth(y, best[:, 0], best[:, 1], best[:, 2], season, keep_errors=True)
+    residuals = errors[2 * season:]
+    return {
+        'alpha': best[:, 0], 'beta': best[:, 1], 'gamma': best[:, 2],
+        'level': level, 'trend': trend, 'season': seasonal,
+        'sigma': np.sqrt((residuals ** 2).mean(axis=0)),
+        'residuals': residuals,
+    }
+
+
+def fit_models(y, season=SEASON, workers=None, block=BLOCK_SERIES):
+    """
+    Fits every column of y (days x series, at least two seasons long).
+    `workers` processes fit blocks of `block` series (None = one per CPU, 1 = in this process).
+    """
+    y = np.asarray(y, dtype='float64')
+    if len(y) < 2 * season:
+        raise ValueError(f"Need at least {2 * season} days of history, got {len(y)}")
+    blocks = [y[:, i:i + block] for i in range(0, y.shape[1], block)]
+    if workers == 1 or len(blocks) <= 1:
+        parts = [fit_block(b, season) for b in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(fit_block, blocks, [season] * len(blocks)))
+    model = {key: np.concatenate([p[key] for p in parts], axis=-1) for key in parts[0]}
+    model['days'] = len(y)
+    model['season_length'] = season
+    return model
+
+
+def forecast(model, horizon):
+    """Returns (mean, std), each horizon x series, for days 1..horizon after the fitted history."""
+    season = model['season_length']
+    steps = np.arange(1, horizon + 1)[:, None]
+    phase = (model['days'] + steps[:, 0] - 1) % season
+    mean = model['level'] + steps * model['trend'] + model['season'][phase]
+    # ETS(A,A,A): var_h = sigma^2 * (1 + sum_{j<h} c_j^2), c_j = alpha * (1 + j * beta) + gamma * (1 - alpha) * [j % season == 0]
+    # In error-correction form _smooth's trend and seasonal gains are alpha * beta and gamma * (1 - alpha)
+    j = steps[:-1]
+    c = model['alpha'] * (1 + j * model['beta']) + model['gamma'] * (1 - model['alpha']) * (j % season == 0)
+    spread = np.vstack([np.zeros((1, mean.shape[1])), np.cumsum(c ** 2, axis=0)])
+    return mean, model['sigma'] * np.sqrt(1 + spread)
+
+
+def combine(model, mean, std, members):
+    """
+    Sums the forecasts of the series selected by the boolean `members`. The variance of the sum is the
+    independent-error variance scaled by the ratio of the summed residuals' variance to the sum of
+    variances, so correlated pairs widen the band. Returns (mean, std) over the horizon.
+    """
+    members = np.asarray(members, dtype=bool)
+    if not members.any():
+        return np.zeros(len(mean)), np.zeros(len(mean))
+    independent = (model['sigma'][members] ** 2).sum()
+    joint = (model['residuals'][:, members].sum(axis=1) ** 2).mean()
+    factor = joint / independent if independent > 0 else 1.0
+    return mean[:, members].sum(axis=1), np.sqrt(factor * (std[:, members] ** 2).sum(axis=1))
+
+
+def forecast_frame(start, mean, std, z=Z_95):
+    """Daily Date / forecast / lower / upper frame starting at `start`."""
+    return pd.DataFrame({
+        'Date': pd.date_range(start, periods=len(mean), freq='D'),
+        'forecast': mean,
+        'lower': mean - z * std,
+        'upper': mean + z * std,
+    })
+
+
+def monthly_frame(daily, std, z=Z_95):
+    """
+    Month / forecast / lower / upper from a daily forecast frame and its std. Daily errors within a
+    month are treated as fully correlated (stds add), which gives a conservative band.
+    """
+    month = daily['Date'].dt.to_period('M').astype(str)
+    grouped = pd.DataFrame({'Month': month, 'forecast': daily['forecast'], 'std': std}).groupby('Month', sort=True).sum()
+    return pd.DataFrame({
+        'Month': grouped.index,
+        'forecast': grouped['forecast'].to_numpy(),
+        'lower': (grouped['forecast'] - z * grouped['std']).to_numpy(),
+        'upper': (grouped['forecast'] + z * grouped['std']).to_numpy(),
+    })
+
+
+# --- CUBE SERIES ---
+
+def pair_series(cube):
+    """Returns (pair mask over domain x location, {measure: days x pairs matrix}) for the pairs with any rows."""
+    recorded = cube.rows.sum(axis=2) > 0
+    return recorded, {
+        'total_value': cube.value[recorded].T.astype('float64'),
+        'total_transactions': cube.transactions[recorded].T.astype('float64'),
+    }
+
+
+def fit_cube(cube, workers=None):
+    """Fits every pair series of both measures. Returns {'pairs': pair mask, 'last_date', measure: model}."""
+    recorded, series = pair_series(cube)
+    models = {measure: fit_models(y, workers=workers) for measure, y in series.items()}
+    models['pairs'] = recorded
+    models['last_date'] = cube.dates[-1]
+    return models
+
+
+def quarter_horizon(last_date):
+    """Days from the day after `last_date` to the end of the next calendar quarter."""
+    start = pd.Timestamp(last_date) + pd.Timedelta(days=1)
+    end = (start.to_period('Q') + (0 if start.is_quarter_start else 1)).end_time.normalize()
+    return max(int((end - start).days) + 1, 1)
+
+
+def grouped_forecasts(models, cube, measure, horizon, domains=None, locations=None):
+    """
+    Forecasts of `measure` for the selected domains and locations (None = all).
+    Returns (daily total frame, monthly total frame, per-Domain frame, per-Location frame); the per-group
+    frames hold each group's forecast over the whole horizon with its band.
+    """
+    model = models[measure]
+    mean, std = forecast(model, horizon)
+    pairs = models['pairs']
+    domain_idx, location_idx = np.nonzero(pairs)
+    keep_domain = np.ones(len(cube.domains), bool) if domains is None else np.isin(cube.domains, list(domains))
+    keep_location = np.ones(len(cube.locations), bool) if locations is None else np.isin(cube.locations, list(locations))
+    selected = keep_domain[domain_idx] & keep_location[location_idx]
+    start = pd.Timestamp(models['last_date']) + pd.Timedelta(days=1)
+
+    total_mean, total_std = combine(model, mean, std, selected)
+    daily = forecast_frame(start, total_mean, total_std)
+    monthly = monthly_frame(daily, total_std)
+
+    def by_group(names, index, keep):
+        rows = []
+        for code in np.flatnonzero(keep):
+            group_mean, group_std = combine(model, mean, std, selected & (index == code))
+            total = group_mean.sum()
+            # Horizon total band: daily stds added (fully correlated days), as in monthly_frame
+            rows.append((names[code], total, total - Z_95 * group_std.sum(), total + Z_95 * group_std.sum()))
+        return pd.DataFrame(rows, columns=['Group', 'forecast', 'lower', 'upper'])
+
+    return (
+        daily, monthly,
+        by_group(cube.domains, domain_idx, keep_domain).rename(columns={'Group': 'Domain'}),
+        by_group(cube.locations, location_idx, keep_location).rename(columns={'Group': 'Location'}),
+    )
@@ -0,0 +1,109 @@
+"""
+Incremental daily-append mode.
+
+The aggregate state (per-key sums, counts and days_recorded) is persisted in the aggregate cache.
+Each new day of transactions is aggregated on its own and merged into the stored state, so a refresh
+costs time proportional to that day's volume instead of rescanning the whole year.
+
+Usage:
+    python incremental.py --bootstrap full_year.csv     # build the initial state from a full file
+    python incremental.py day_2023-01-01.csv            # append one new day
+"""
+import argparse
+import os
+
+import pandas as pd
+
+from aggregate_cache import read_frames, write_frames
+from config import CACHE_DIR, CHUNK_SIZE, DATA_PATH, INGEST_WORKERS
+from ingestion import (
+    AGGREGATION_VERSION, RAW_COLUMNS, RAW_DTYPES, STATE_TABLES,
+    merge_day, summaries_from_state,
+)
+from parallel_ingest import parallel_state
+
+STATE_KEY = f"incremental-v{AGGREGATION_VERSION}"
+
+
+def save_state(state, cache_dir=CACHE_DIR):
+    """Persists the aggregate state as Arrow files."""
+    frames = {name: state[name].reset_index() for name in STATE_TABLES}
+    frames['dates'] = state['dates']
+    frames['cells'] = state['cells']
+    frames['sketches'] = state['sketches']
+    write_frames(cache_dir, STATE_KEY, frames, meta={
+        'days': len(state['dates']),
+        'last_date': state['dates']['Date'].max().strftime('%Y-%m-%d'),
+    })
+
+
+def load_state(cache_dir=CACHE_DIR):
+    """Loads the stored aggregate state, or returns (None, None) when no state has been bootstrapped."""
+    frames, meta = read_frames(cache_dir, STATE_KEY)
+    if frames is None:
+        return None, None
+    state = {name: frames[name].set_index(keys) for name, keys in STATE_TABLES.items()}
+    state['dates'] = frames['dates']
+    state['cells'] = frames['cells']
+    state['sketches'] = frames['sketches']
+    return state, meta
+
+
+def state_version(cache_dir=CACHE_DIR):
+    """Returns a token that changes whenever the stored state is rewritten (used to key in-process caches)."""
+    meta_path = os.path.join(cache_dir, 'aggregates', STATE_KEY, 'meta.json')
+    return os.stat(meta_path).st_mtime_ns if os.path.exists(meta_path) else None
+
+
+def bootstrap_state(data_path, chunksize=CHUNK_SIZE, cache_dir=CACHE_DIR):
+    """Builds the initial state from a full raw file (on the ingest process pool) and stores it."""
+    state, stats = parallel_state(data_path, chunksize, INGEST_WORKERS)
+    save_state(state, cache_dir)
+    return state, stats
+
+
+def append_day(day_path, cache_dir=CACHE_DIR):
+    """Merges the rows of a new day's file into the stored state and saves it."""
+    state, _ = load_state(cache_dir)
+    if state is None:
+        raise RuntimeError("No incremental state found. Run with --bootstrap first.")
+    day_rows = pd.read_csv(
+        day_path,
+        usecols=RAW_COLUMNS,
+        dtype=RAW_DTYPES,
+    )
+    state = merge_day(state, day_rows)
+    save_state(state, cache_dir)
+    return state
+
+
+def load_incremental_summaries(cache_dir=CACHE_DIR, data_path=DATA_PATH, chunksize=CHUNK_SIZE):
+    """
+    Returns (summaries, stats) from the stored state, bootstrapping it from `data_path` if needed.
+    Returns (None, None) when there is neither a stored state nor a source file.
+    """
+    state, meta = load_state(cache_dir)
+    if state is None:
+        if not data_path:
+            return None, None
+        state, _ = bootstrap_state(data_path, chunksize, cache_dir)
+        _, meta = load_state(cache_dir)
+    return summaries_from_state(state), {'days': meta['days'], 'last_date': meta['last_date']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the incremental aggregate state.")
+    parser.add_argument('path', help="Raw transaction CSV (a new day, or the full file with --bootstrap)")
+    parser.add_argument('--bootstrap', action='store_true', help="Rebuild the state from a full file")
+    args = parser.parse_args()
+
+    if args.bootstrap:
+        state, stats = bootstrap_state(args.path)
+        print(f"Bootstrapped {len(state['dates'])} days from {stats['rows']:,} rows ({stats['rows_per_sec']:,.0f} rows/s)")
+    else:
+        state = append_day(args.path)
+        print(f"State now covers {len(state['dates'])} days up to {state['dates']['Date'].max():%Y-%m-%d}")
+
+
+if __name__ == '__main__':
+    main()
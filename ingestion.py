@@ -0,0 +1,212 @@
+"""
+Streaming ingestion of the raw transaction file.
+
+The raw file (Date, Domain, Location, Value, Transaction_count) is read in bounded-size chunks.
+Each chunk is reduced to a small (Date, Domain, Location) partial aggregate, the partials are folded
+into a running total, and every dashboard summary is derived from that total. Peak memory therefore
+depends on the chunk size and the number of Date x Domain x Location cells, never on the file size.
+Alongside, each chunk's transaction values are added to mergeable per-Domain / per-Location sketches
+(see sketches.py), the only part of the state that keeps anything of the value distribution.
+"""
+import sys
+import time
+
+import pandas as pd
+
+from schema import RAW_DTYPES
+from sketches import distinct_sketches, merge_sketches, value_sketches
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
+RAW_COLUMNS = ['Date', 'Domain', 'Location', 'Value', 'Transaction_count']
+PARTIAL_KEYS = ['Date', 'Domain', 'Location']
+WEEKDAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Bump whenever the aggregation logic changes, so cached aggregates built by older code are invalidated
+AGGREGATION_VERSION = 3
+
+
+def peak_rss_mb():
+    """Returns the peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KB everywhere else
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def read_chunks(path, chunksize):
+    """Yields the raw transaction file as DataFrames of at most `chunksize` rows."""
+    return pd.read_csv(
+        path,
+        usecols=RAW_COLUMNS,
+        dtype=RAW_DTYPES,
+        chunksize=chunksize,
+    )
+
+
+def aggregate_chunk(chunk):
+    """Reduces a raw chunk to Value / Transaction_count sums and row counts per (Date, Domain, Location)."""
+    partial = chunk.groupby(PARTIAL_KEYS, observed=True, sort=False).agg(
+        Value=('Value', 'sum'),
+        Transaction_count=('Transaction_count', 'sum'),
+        rows=('Value', 'size'),
+    ).astype({'Transaction_count': 'int64'}).reset_index()
+    # Dates are parsed after grouping, so only one value per distinct day is converted
+    partial['Date'] = pd.to_datetime(partial['Date'].astype(str))
+    partial['Domain'] = partial['Domain'].astype(str)
+    partial['Location'] = partial['Location'].astype(str)
+    return partial
+
+
+def combine_partials(partials):
+    """Merges partial aggregates by summing matching (Date, Domain, Location) cells."""
+    partials = [p for p in partials if p is not None and not p.empty]
+    if not partials:
+        return pd.DataFrame(columns=PARTIAL_KEYS + ['Value', 'Transaction_count', 'rows'])
+    combined = pd.concat(partials, ignore_index=True)
+    return combined.groupby(PARTIAL_KEYS, sort=True).sum().reset_index()
+
+
+STATE_TABLES = {
+    'domain': ['Domain'],
+    'location': ['Location'],
+    'pair': ['Domain', 'Location'],
+    'month': ['Month'],
+    'weekday': ['dayofweek'],
+}
+STATE_COUNT_COLUMNS = ['total_transactions', 'rows', 'days_recorded']
+
+
+def state_from_partial(partial, values=None):
+    """
+    Rolls a (Date, Domain, Location) partial up into the aggregate state: per-key sums, row counts and
+    days_recorded for every grouping the dashboard shows, the set of dates already ingested, the
+    (Date, Domain, Location) cells themselves, from which cube.Cube answers filtered queries, and the
+    sketches: distinct counts sketched from the partial plus `values`, the value sketches of its raw rows.
+    """
+    partial = partial.assign(
+        Month=partial['Date'].dt.to_period('M').astype(str),
+        dayofweek=partial['Date'].dt.day_name(),
+    )
+    state = {}
+    for name, keys in STATE_TABLES.items():
+        state[name] = partial.groupby(keys).agg(
+            total_value=('Value', 'sum'),
+            total_transactions=('Transaction_count', 'sum'),
+            rows=('rows', 'sum'),
+            days_recorded=('Date', 'nunique'),
+        ).astype({col: 'int64' for col in STATE_COUNT_COLUMNS})
+    state['dates'] = pd.DataFrame({'Date': pd.Series(partial['Date'].unique()).sort_values(ignore_index=True)})
+    state['cells'] = partial[PARTIAL_KEYS + ['Value', 'Transaction_count', 'rows']].sort_values(PARTIAL_KEYS, ignore_index=True)
+    state['sketches'] = merge_sketches([distinct_sketches(partial), values])
+    return state
+
+
+def merge_states(state, other):
+    """
+    Adds the sums and counts of `other` into `state` key by key.
+    The two states must cover disjoint dates, otherwise days_recorded would be double counted.
+    """
+    overlap = state['dates'].merge(other['dates'], on='Date')
+    if not overlap.empty:
+        raise ValueError(f"Dates already ingested: {', '.join(overlap['Date'].dt.strftime('%Y-%m-%d'))}")
+    merged = {}
+    for name in STATE_TABLES:
+        merged[name] = state[name].add(other[name], fill_value=0).astype({col: 'int64' for col in STATE_COUNT_COLUMNS})
+    merged['dates'] = pd.concat([state['dates'], other['dates']]).sort_values('Date', ignore_index=True)
+    merged['cells'] = pd.concat([state['cells'], other['cells']]).sort_values(PARTIAL_KEYS, ignore_index=True)
+    merged['sketches'] = merge_sketches([state['sketches'], other['sketches']])
+    return merged
+
+
+def merge_day(state, day_rows):
+    """
+    Merges one new day of raw rows into the aggregate state.
+    Only the new rows are aggregated, so the cost is proportional to that day's volume, and every
+    average is recomputed exactly from the updated sums and days_recorded.
+    """
+    return merge_states(state, state_from_partial(aggregate_chunk(day_rows), value_sketches(day_rows)))
+
+
+def summaries_from_state(state):
+    """Derives every dashboard summary frame, plus the day-level 'cells' and the 'sketches', from the aggregate state."""
+    by_domain = state['domain'].copy()
+    by_domain['avg_daily_value'] = by_domain['total_value'] / by_domain['days_recorded']
+    by_domain['avg_daily_count'] = by_domain['total_transactions'] / by_domain['days_recorded']
+    domain_summary = by_domain.reset_index().sort_values('total_value', ascending=False, ignore_index=True)[
+        ['Domain', 'avg_daily_value', 'avg_daily_count', 'total_value', 'total_transactions', 'days_recorded']
+    ]
+
+    by_location = state['location'].copy()
+    # Per-row means, matching how the regional table was originally computed from the raw file
+    by_location['avg_txn_value'] = by_location['total_value'] / by_location['rows']
+    by_location['avg_txn_count'] = by_location['total_transactions'] / by_location['rows']
+    regional_perf = by_location.reset_index()[
+        ['Location', 'avg_txn_value', 'avg_txn_count', 'total_transactions', 'total_value', 'days_recorded']
+    ]
+
+    monthly_summary = state['month'].reset_index()[['Month', 'total_value', 'total_transactions']]
+
+    daily_summary = state['weekday'].reset_index()[['dayofweek', 'total_value', 'total_transactions']]
+    daily_summary['dayofweek'] = pd.Categorical(daily_summary['dayofweek'], categories=WEEKDAY_ORDER, ordered=True)
+    daily_summary = daily_summary.sort_values('dayofweek', ignore_index=True)
+
+    by_pair = state['pair'].copy()
+    by_pair['avg_daily_value'] = by_pair['total_value'] / by_pair['days_recorded']
+    by_pair['avg_daily_count'] = by_pair['total_transactions'] / by_pair['days_recorded']
+    dc = by_pair.reset_index()[
+        ['Domain', 'Location', 'avg_daily_value', 'avg_daily_count', 'total_value', 'total_transactions']
+    ]
+
+    return {
+        'domain_summary': domain_summary,
+        'regional_perf': regional_perf,
+        'monthly_summary': monthly_summary,
+        'daily_summary': daily_summary,
+        'dc': dc,
+        'cells': state['cells'],
+        'sketches': state['sketches'],
+    }
+
+
+def build_summaries(partial):
+    """Derives every dashboard summary frame from a (Date, Domain, Location) partial aggregate."""
+    return summaries_from_state(state_from_partial(partial))
+
+
+def stream_state(path, chunksize=1_000_000):
+    """
+    Streams the raw transaction file once and returns (state, stats).
+    `stats` reports rows, chunks, elapsed seconds, rows-per-second throughput and peak RSS.
+    """
+    start = time.perf_counter()
+    running = None
+    values = None
+    rows = 0
+    chunks = 0
+    for chunk in read_chunks(path, chunksize):
+        rows += len(chunk)
+        chunks += 1
+        running = combine_partials([running, aggregate_chunk(chunk)])
+        values = merge_sketches([values, value_sketches(chunk)])
+
+    state = state_from_partial(combine_partials([running]), values)
+    elapsed = time.perf_counter() - start
+    stats = {
+        'rows': rows,
+        'chunks': chunks,
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    return state, stats
+
+
+def stream_transactions(path, chunksize=1_000_000):
+    """Streams the raw transaction file once and returns (summaries, stats)."""
+    state, stats = stream_state(path, chunksize)
+    return summaries_from_state(state), stats
@@ -0,0 +1,193 @@
+"""
+Statistics behind the dashboard's written observations.
+
+Each *_stats function reduces one summary table to a small dict of peaks, dips, ranges and spreads; the
+app computes it once per data version through the shared cache. The *_observations functions only
+format those dicts as markdown, so the text follows the data on every refresh and a rerun makes no
+pass over the tables.
+"""
+import pandas as pd
+
+# Bump when the layout of the stats dicts changes, so cached entries from older code are not reused
+VERSION = 1
+
+# Periods within this fraction of the average are neither peaks nor dips
+TOLERANCE = 0.005
+# (max - min) / mean below which values are described as uniform, and below which as mildly varying
+UNIFORM_SPREAD = 0.02
+MILD_SPREAD = 0.10
+
+
+def spread(values):
+    """min, max, mean, max - min and (max - min) / mean of a numeric column."""
+    values = pd.to_numeric(values).astype('float64')
+    lo, hi, mean = float(values.min()), float(values.max()), float(values.mean())
+    return {'min': lo, 'max': hi, 'mean': mean, 'range': hi - lo, 'relative': (hi - lo) / mean if mean else 0.0}
+
+
+def describe_spread(relative):
+    """Words for a relative spread."""
+    if relative < UNIFORM_SPREAD:
+        return 'nearly uniform'
+    if relative < MILD_SPREAD:
+        return 'mildly varying'
+    return 'strongly varying'
+
+
+def _deviation(values):
+    """Fraction above (+) or below (-) the mean, per element."""
+    values = pd.to_numeric(values).to_numpy(dtype='float64')
+    mean = values.mean()
+    return values / mean - 1 if mean else values * 0
+
+
+def period_stats(labels, df, value='total_value', count='total_transactions', tolerance=TOLERANCE, n=3):
+    """
+    Peaks and dips of one period table (months or weekdays) plus the value and count spreads.
+    Peaks / dips are up to `n` (label, value deviation, count deviation) tuples whose value lies more than
+    `tolerance` above / below the average, strongest first.
+    """
+    value_dev = _deviation(df[value])
+    count_dev = _deviation(df[count])
+    order = value_dev.argsort(kind='stable')
+    entries = [(labels[i], float(value_dev[i]), float(count_dev[i])) for i in order]
+    return {
+        'periods': len(df),
+        'value': spread(df[value]),
+        'count': spread(df[count]),
+        'peaks': [e for e in reversed(entries) if e[1] > tolerance][:n],
+        'dips': [e for e in entries if e[1] < -tolerance][:n],
+        'tolerance': tolerance,
+    }
+
+
+def monthly_stats(monthly_summary):
+    """period_stats of the monthly table, labelled by month name (with the year if several years are shown)."""
+    months = pd.PeriodIndex(monthly_summary['Month'].astype(str), freq='M')
+    fmt = '%B' if months.year.nunique() <= 1 else '%B %Y'
+    return period_stats(list(months.strftime(fmt)), monthly_summary)
+
+
+def weekday_stats(daily_summary):
+    """period_stats of the weekday table."""
+    return period_stats(list(daily_summary['dayofweek'].astype(str)), daily_summary)
+
+
+def domain_stats(domain_summary):
+    """Spreads of the per-domain daily averages."""
+    return {
+        'domains': len(domain_summary),
+        'daily_value': spread(domain_summary['avg_daily_value']),
+        'daily_count': spread(domain_summary['avg_daily_count']),
+    }
+
+
+def regional_stats(regional_perf):
+    """Spreads of the per-location averages and totals, the leading / trailing locations and coverage in days."""
+    locations = regional_perf['Location'].astype(str).to_numpy()
+    days = regional_perf['days_recorded']
+    return {
+        'locations': len(regional_perf),
+        'avg_value': spread(regional_perf['avg_txn_value']),
+        'avg_count': spread(regional_perf['avg_txn_count']),
+        'total_value': spread(regional_perf['total_value']),
+        'total_count': spread(regional_perf['total_transactions']),
+        'leader': str(locations[regional_perf['total_value'].argmax()]),
+        'trailer': str(locations[regional_perf['total_value'].argmin()]),
+        'max_days': int(days.max()),
+        'complete': int((days == days.max()).sum()),
+        'fewest_days': (str(regional_perf['Location'].iloc[days.argmin()]), int(days.min())),
+    }
+
+
+# --- MARKDOWN ---
+
+def _signed(fraction):
+    return f"{fraction * 100:+.1f}%"
+
+
+def _periods(entries):
+    return ', '.join(f"**{label}** ({_signed(v)} value, {_signed(c)} transactions)" for label, v, c in entries)
+
+
+def _period_bullets(stats, unit, average):
+    """Peak, dip and spread bullets shared by the monthly and weekday observations."""
+    tolerance = f"{stats['tolerance'] * 100:.1f}%"
+    peaks = _periods(stats['peaks']) or f"No {unit} is more than {tolerance} above the {average}."
+    dips = _periods(stats['dips']) or f"No {unit} is more than {tolerance} below the {average}."
+    value = stats['value']
+    return [
+        f"- **Peaks (High Activity):** {peaks}",
+        f"- **Dips (Low Activity):** {dips}",
+        f"- **Spread:** {unit.capitalize()} totals range from **₹{value['min'] / 1e9:,.2f}B to ₹{value['max'] / 1e9:,.2f}B**, "
+        f"{value['relative'] * 100:.2f}% of the {average} ({describe_spread(value['relative'])}).",
+    ]
+
+
+def monthly_observations(stats):
+    """Markdown bullets for the monthly trend (deviations are relative to the monthly average)."""
+    return '\n'.join(_period_bullets(stats, 'month', 'monthly average'))
+
+
+def weekday_observations(stats, monthly=None):
+    """Markdown bullets for the weekday trend, followed by an overall line if the monthly stats are given."""
+    lines = _period_bullets(stats, 'weekday', 'weekday average')
+    if monthly is not None:
+        lines += [
+            '',
+            f"*Overall: monthly activity is {describe_spread(monthly['value']['relative'])} "
+            f"({monthly['value']['relative'] * 100:.1f}% spread) and weekday activity is "
+            f"{describe_spread(stats['value']['relative'])} ({stats['value']['relative'] * 100:.1f}% spread).*",
+        ]
+    return '\n'.join(lines)
+
+
+def domain_observations(stats):
+    """Markdown bullets for the domain-level daily averages."""
+    value, count = stats['daily_value'], stats['daily_count']
+    lines = [
+        f"- **Daily Revenue:** Average daily revenue per domain ranges from **₹{value['min']:,.2f} to ₹{value['max']:,.2f}** ({describe_spread(value['relative'])}).",
+        f"- **Monetary Context:** The difference between the highest and lowest daily average is **₹{value['range']:,.2f}**, which is **{value['relative'] * 100:.2f}%** of the mean daily average.",
+        f"- **Daily Transactions:** Average daily transaction volumes range from **{count['min']:,.0f} to {count['max']:,.0f}** transactions per day ({describe_spread(count['relative'])}).",
+    ]
+    if max(value['relative'], count['relative']) < UNIFORM_SPREAD:
+        lines += [
+            "- All Domains are making consistent transactions.",
+            "- This homogeneity suggests that the bank has a **well-diversified and stable transaction portfolio**, and is **not overly dependent on any single domain** for revenue or transaction volume.",
+        ]
+    return '\n'.join(lines)
+
+
+def regional_observations(stats):
+    """Markdown bullets for the regional averages, totals and coverage."""
+    value, count, totals = stats['avg_value'], stats['avg_count'], stats['total_value']
+    lines = [
+        f"- Average daily transaction value across the {stats['locations']} locations ranges between **₹{value['min']:,.0f} to ₹{value['max']:,.0f}** per day "
+        f"(approx. ₹{value['min'] / 1e5:,.2f} Lakh to ₹{value['max'] / 1e5:,.2f} Lakh, {describe_spread(value['relative'])}).",
+        f"- Daily transaction volumes vary between **{count['min']:,.0f} to {count['max']:,.0f} transactions/day** ({describe_spread(count['relative'])}).",
+    ]
+    if max(totals['relative'], stats['total_count']['relative']) < UNIFORM_SPREAD:
+        lines += [
+            f"- **Total transaction value and yearly transaction counts are nearly identical for all cities** (value spread {totals['relative'] * 100:.2f}%), suggesting:",
+            "    * Equal transaction opportunities across regions.",
+            "    * No region is significantly outperforming or underperforming.",
+        ]
+    else:
+        lines.append(
+            f"- Total transaction value differs by **{totals['relative'] * 100:.1f}%** of the average city, "
+            f"from **{stats['leader']}** (highest) to **{stats['trailer']}** (lowest)."
+        )
+    if stats['complete'] == stats['locations']:
+        lines += [
+            f"- Operational consistency is very high, with all cities having complete **{stats['max_days']}-day activity**, showing:",
+            "    * No city-level outages.",
+            "    * Uniform customer engagement.",
+            "    * Balanced merchant penetration across cities.",
+        ]
+    else:
+        city, days = stats['fewest_days']
+        lines.append(
+            f"- {stats['complete']} of {stats['locations']} cities recorded activity on all **{stats['max_days']} days**; "
+            f"the fewest is **{city}** with {days} days."
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,141 @@
+"""
+Multi-core aggregation of the raw transaction file.
+
+The file is split into byte-range partitions aligned to line boundaries. Each partition is streamed in
+bounded-size chunks and reduced to a (Date, Domain, Location) partial aggregate on a process pool; the
+partials are combined in partition order and rolled up into the same aggregate state (and therefore the
+same summary frames) as the single-pass reader in ingestion.py. Each partition also returns the value
+sketches of its rows, which merge into exactly the sketches of the whole file.
+
+The partitioning depends only on the file, never on the worker count, and partials are always combined
+in the same order, so `workers=1` (every partition in this process) returns identical results and is
+the fallback used for testing and on machines where a process pool is unavailable.
+"""
+import io
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from ingestion import (
+    RAW_COLUMNS, RAW_DTYPES,
+    aggregate_chunk, combine_partials, peak_rss_mb, state_from_partial, summaries_from_state,
+)
+from sketches import merge_sketches, value_sketches
+
+# Target partition size; files smaller than one partition per CPU are split into one per CPU instead
+PARTITION_BYTES = 256 * 1024 * 1024
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file, so read_csv can stream one partition."""
+
+    def __init__(self, path, start, end):
+        self._fh = open(path, 'rb')
+        self._fh.seek(start)
+        self._left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._left <= 0:
+            return 0
+        read = self._fh.readinto(memoryview(buffer)[:min(len(buffer), self._left)])
+        self._left -= read
+        return read
+
+    def close(self):
+        self._fh.close()
+        super().close()
+
+
+def read_header(path):
+    """Returns (column names, byte offset of the first data row)."""
+    with open(path, 'rb') as fh:
+        header = fh.readline()
+    return header.decode('utf-8-sig').strip().split(','), len(header)
+
+
+def partition_file(path, n_partitions=None):
+    """
+    Splits the data rows of `path` into at most `n_partitions` byte ranges that start and end on line
+    boundaries. By default one partition per PARTITION_BYTES, and at least one per CPU.
+    """
+    _, data_start = read_header(path)
+    size = os.path.getsize(path)
+    if n_partitions is None:
+        n_partitions = max(os.cpu_count() or 1, math.ceil(size / PARTITION_BYTES))
+
+    bounds = [data_start]
+    with open(path, 'rb') as fh:
+        for i in range(1, n_partitions):
+            target = data_start + (size - data_start) * i // n_partitions
+            if target <= bounds[-1]:
+                continue
+            # Move the boundary to the start of the next line
+            fh.seek(target - 1)
+            fh.readline()
+            if fh.tell() >= size:
+                break
+            if fh.tell() > bounds[-1]:
+                bounds.append(fh.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def aggregate_partition(path, start, end, names, chunksize=1_000_000):
+    """Streams one byte range of the raw file and returns (partial aggregate, value sketches, rows, chunks); runs in the workers."""
+    running = None
+    values = None
+    rows = 0
+    chunks = 0
+    with io.BufferedReader(_ByteRange(path, start, end), buffer_size=1024 * 1024) as fh:
+        for chunk in pd.read_csv(fh, header=None, names=names, usecols=RAW_COLUMNS, dtype=RAW_DTYPES, chunksize=chunksize):
+            rows += len(chunk)
+            chunks += 1
+            running = combine_partials([running, aggregate_chunk(chunk)])
+            values = merge_sketches([values, value_sketches(chunk)])
+    return running, values, rows, chunks
+
+
+def parallel_state(path, chunksize=1_000_000, workers=None, n_partitions=None):
+    """
+    Aggregates the raw file partition by partition on `workers` processes (None = one per CPU,
+    1 = in this process) and returns (state, stats) like ingestion.stream_state.
+    """
+    start = time.perf_counter()
+    names, _ = read_header(path)
+    partitions = partition_file(path, n_partitions)
+    jobs = [(path, lo, hi, names, chunksize) for lo, hi in partitions]
+
+    if workers == 1 or len(jobs) <= 1:
+        results = [aggregate_partition(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(aggregate_partition, *zip(*jobs)))
+
+    state = state_from_partial(
+        combine_partials([partial for partial, _, _, _ in results]),
+        merge_sketches([values for _, values, _, _ in results]),
+    )
+    rows = sum(r for _, _, r, _ in results)
+    elapsed = time.perf_counter() - start
+    stats = {
+        'rows': rows,
+        'chunks': sum(c for _, _, _, c in results),
+        'partitions': len(partitions),
+        'workers': 1 if workers == 1 or len(jobs) <= 1 else (workers or os.cpu_count()),
+        'seconds': elapsed,
+        'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    return state, stats
+
+
+def parallel_transactions(path, chunksize=1_000_000, workers=None):
+    """Aggregates the raw file on a process pool and returns (summaries, stats)."""
+    state, stats = parallel_state(path, chunksize, workers)
+    return summaries_from_state(state), stats
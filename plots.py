@@ -0,0 +1,171 @@
+"""
+Matplotlib/seaborn plot helpers for the dashboard sections.
+
+Each helper returns a matplotlib figure; callers are expected to encode and close it (see FigureCache).
+matplotlib and seaborn are imported inside the helpers so importing this module stays cheap.
+"""
+import profiling
+
+
+def plot_top_10_regional(top10_value, top10_count):
+    """Plots top 10 locations by total value and total transactions (each frame already in rank order)."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if top10_value.empty:
+        return plt.figure(figsize=(1, 1))
+
+    fig, axes = plt.subplots(1, 2, figsize=(18, 6))
+
+    sns.barplot(x='Location', y='total_value', data=top10_value, ax=axes[0], palette="viridis")
+    axes[0].set_title('Top 10 Locations by Total Value (₹)', fontsize=16)
+    axes[0].tick_params(axis='x', rotation=45)
+    axes[0].set_xlabel("")
+    axes[0].set_ylabel("Total Value") 
+    axes[0].ticklabel_format(style='plain', axis='y') 
+
+    sns.barplot(x='Location', y='total_transactions', data=top10_count, ax=axes[1], palette="magma")
+    axes[1].set_title('Top 10 Locations by Total Transactions (Volume)', fontsize=16)
+    axes[1].tick_params(axis='x', rotation=45)
+    axes[1].set_xlabel("")
+    axes[1].set_ylabel("Total Transactions")
+    axes[1].ticklabel_format(style='plain', axis='y')
+
+    plt.tight_layout()
+    return fig
+
+
+def plot_temporal_trends(monthly_df, daily_df):
+    """Plots monthly and daily transaction trends."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if monthly_df.empty or daily_df.empty:
+        return plt.figure(figsize=(1, 1))
+        
+    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+
+    # Monthly Value Trend
+    sns.lineplot(x='Month', y='total_value', data=monthly_df, ax=axes[0, 0], marker='o', color='forestgreen')
+    axes[0, 0].set_title('Monthly Total Value Trend (Seasonality)', fontsize=16)
+    axes[0, 0].tick_params(axis='x', rotation=45)
+    axes[0, 0].set_ylabel("Total Value")
+    axes[0, 0].set_xlabel("")
+
+    # Monthly Transaction Trend
+    sns.lineplot(x='Month', y='total_transactions', data=monthly_df, ax=axes[0, 1], marker='o', color='darkorange')
+    axes[0, 1].set_title('Monthly Total Transactions Trend (Volume)', fontsize=16)
+    axes[0, 1].tick_params(axis='x', rotation=45)
+    axes[0, 1].set_ylabel("Total Transactions")
+    axes[0, 1].set_xlabel("")
+
+    # Daily Value Trend
+    sns.barplot(x='dayofweek', y='total_value', data=daily_df, ax=axes[1, 0], palette="Blues_d")
+    axes[1, 0].set_title('Daily Total Value Trend (Weekday vs. Weekend)', fontsize=16)
+    axes[1, 0].set_ylabel("Total Value")
+    axes[1, 0].set_xlabel("")
+
+    # Daily Transaction Trend
+    sns.barplot(x='dayofweek', y='total_transactions', data=daily_df, ax=axes[1, 1], palette="Reds_d")
+    axes[1, 1].set_title('Daily Total Transactions Trend (Volume)', fontsize=16)
+    axes[1, 1].set_ylabel("Total Transactions")
+    axes[1, 1].set_xlabel("")
+
+    plt.tight_layout(pad=3.0)
+    return fig
+
+
+def plot_forecast(monthly_df, value_forecast, count_forecast):
+    """Plots monthly totals followed by the next-quarter forecast and its 95% band, for value and transactions."""
+    import matplotlib.pyplot as plt
+    if monthly_df.empty or value_forecast.empty:
+        return plt.figure(figsize=(1, 1))
+
+    fig, axes = plt.subplots(1, 2, figsize=(18, 6))
+    months = list(monthly_df['Month'].astype(str)) + list(value_forecast['Month'])
+    positions = {month: i for i, month in enumerate(months)}
+
+    for ax, metric, forecast_df, color, title in (
+        (axes[0], 'total_value', value_forecast, 'forestgreen', 'Monthly Total Value with Next-Quarter Forecast'),
+        (axes[1], 'total_transactions', count_forecast, 'darkorange', 'Monthly Total Transactions with Next-Quarter Forecast'),
+    ):
+        x_hist = [positions[m] for m in monthly_df['Month'].astype(str)]
+        x_fc = [positions[m] for m in forecast_df['Month']]
+        ax.plot(x_hist, monthly_df[metric], marker='o', color=color, label='Actual')
+        ax.plot(x_fc, forecast_df['forecast'], marker='o', linestyle='--', color=color, label='Forecast')
+        ax.fill_between(x_fc, forecast_df['lower'], forecast_df['upper'], color=color, alpha=0.2, label='95% band')
+        ax.set_xticks(range(len(months)))
+        ax.set_xticklabels(months, rotation=45)
+        ax.set_title(title, fontsize=16)
+        ax.set_ylabel(metric.replace('_', ' ').title())
+        ax.legend()
+
+    plt.tight_layout()
+    return fig
+
+
+def plot_domain_location_matrix(df):
+    """Plots a heatmap of Total Value by Domain and Location."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if df.empty:
+        return plt.figure(figsize=(1, 1))
+        
+    # Pivot for Heatmap visualization
+    with profiling.stage('heatmap:pivot_table'):
+        pivot_table = df.pivot_table(
+            index='Location', 
+            columns='Domain', 
+            values='total_value', 
+            aggfunc='sum'
+        )
+    
+    plt.figure(figsize=(20, 15))
+    with profiling.stage('heatmap:seaborn'):
+        sns.heatmap(
+            pivot_table, 
+            cmap="YlGnBu", 
+            annot=False, 
+            fmt=".1f",
+            linewidths=.5, 
+            cbar_kws={'label': 'Total Value'}
+        )
+    plt.title('Domain-Location Performance Matrix (Total Value)', fontsize=18)
+    plt.xlabel('Domain')
+    plt.ylabel('Location')
+    plt.tight_layout()
+    return plt.gcf()
+
+
+def plot_clustering_scores(elbow_df, silhouette_df):
+    """Plots the Elbow Chart and the Silhouette Score trend."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    fig, axes = plt.subplots(1, 2, figsize=(18, 6))
+
+    # 1. Elbow Chart (Inertia)
+    sns.lineplot(x='K', y='Inertia', data=elbow_df, marker='o', ax=axes[0], color='blue')
+    axes[0].set_title('Elbow Method (Inertia)', fontsize=16)
+    axes[0].set_xlabel('Number of Clusters (K)')
+    axes[0].set_ylabel('Inertia')
+    axes[0].set_xticks(elbow_df['K'])
+    axes[0].grid(True, linestyle='--', alpha=0.6)
+    
+    # Highlight k=3 for the elbow point visualization
+    axes[0].axvline(x=3, color='r', linestyle='--', label='Optimal K=3')
+    axes[0].legend()
+
+
+    # 2. Silhouette Score Chart
+    sns.lineplot(x='K', y='Score', data=silhouette_df, marker='o', ax=axes[1], color='purple')
+    axes[1].set_title('Silhouette Score Analysis', fontsize=16)
+    axes[1].set_xlabel('Number of Clusters (K)')
+    axes[1].set_ylabel('Silhouette Score')
+    axes[1].set_xticks(silhouette_df['K'])
+    axes[1].grid(True, linestyle='--', alpha=0.6)
+    best_k = int(silhouette_df.loc[silhouette_df['Score'].idxmax(), 'K'])
+    axes[1].axvline(x=best_k, color='g', linestyle=':', label=f'Highest Score K={best_k}') # Highlight highest score
+    axes[1].axvline(x=3, color='r', linestyle='--', label='Selected K=3') # Highlight k=3 selection
+    axes[1].legend()
+
+    plt.tight_layout()
+    return fig
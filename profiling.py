@@ -0,0 +1,129 @@
+"""
+Hot-path instrumentation for dashboard reruns.
+
+`stage(name)` times a block and records its RSS delta in the current run, `cache_event()` counts cache
+hits and misses process-wide, and `finish_run()` closes the run and optionally appends it to a JSON-lines
+log so production reruns can be compared over time. Runs are tracked per thread because Streamlit
+executes each session's script run on its own thread; `bind()` lets work the rerun hands to a thread pool
+record into the same run.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from ingestion import peak_rss_mb
+
+_local = threading.local()
+_counter_lock = threading.Lock()
+CACHE_COUNTERS = defaultdict(lambda: {'hit': 0, 'miss': 0})
+
+
+def current_rss_mb():
+    """Current resident set size in MB (falls back to the peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+
+def start_run():
+    """Starts recording a new rerun on this thread."""
+    _local.run = {'started': time.time(), 'start': time.perf_counter(), 'stages': []}
+    _local.missed = set()
+
+
+def _current_run():
+    if getattr(_local, 'run', None) is None:
+        start_run()
+    return _local.run
+
+
+def record_stage(name, seconds, rss_delta_mb=None):
+    """Records a stage that was timed elsewhere."""
+    _current_run()['stages'].append({'stage': name, 'seconds': seconds, 'rss_delta_mb': rss_delta_mb})
+
+
+@contextmanager
+def stage(name):
+    """Times the enclosed block and records its duration and RSS delta in the current run."""
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rss_after = current_rss_mb()
+        record_stage(
+            name,
+            time.perf_counter() - start,
+            None if rss_before is None or rss_after is None else rss_after - rss_before,
+        )
+
+
+def bind(fn):
+    """Wraps `fn` so that, run on another thread, its stages and cache misses are recorded in this thread's run."""
+    run = _current_run()
+    if getattr(_local, 'missed', None) is None:
+        _local.missed = set()
+    missed = _local.missed
+
+    def bound(*args, **kwargs):
+        _local.run, _local.missed = run, missed
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.run, _local.missed = None, None
+
+    return bound
+
+
+def cache_event(name, hit):
+    """Counts a cache hit or miss for `name`."""
+    with _counter_lock:
+        CACHE_COUNTERS[name]['hit' if hit else 'miss'] += 1
+
+
+def mark_miss(name):
+    """Called inside a memoised function body: its execution means the memo missed."""
+    if getattr(_local, 'missed', None) is None:
+        _local.missed = set()
+    _local.missed.add(name)
+
+
+def cached_call(name, fn, *args, **kwargs):
+    """Calls a memoised function and counts a hit unless its body ran (and called mark_miss) during the call."""
+    if getattr(_local, 'missed', None) is None:
+        _local.missed = set()
+    _local.missed.discard(name)
+    result = fn(*args, **kwargs)
+    cache_event(name, hit=name not in _local.missed)
+    return result
+
+
+def counters():
+    """Snapshot of the process-wide cache counters."""
+    with _counter_lock:
+        return {name: dict(counts) for name, counts in CACHE_COUNTERS.items()}
+
+
+def finish_run(label, log_path=None):
+    """Closes the current run, appends it to `log_path` as one JSON line if given, and returns it."""
+    run = _current_run()
+    record = {
+        'label': label,
+        'timestamp': run['started'],
+        'total_seconds': time.perf_counter() - run['start'],
+        'rss_mb': current_rss_mb(),
+        'stages': run['stages'],
+        'cache': counters(),
+    }
+    if log_path:
+        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+        with open(log_path, 'a') as fh:
+            fh.write(json.dumps(record) + '\n')
+    _local.run = None
+    return record
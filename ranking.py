@@ -0,0 +1,95 @@
+"""
+Pre-sorted rank arrays for the dashboard's top-K and per-cluster ranking panels.
+
+A RankIndex holds, for each metric of one summary table, the row positions in descending metric order.
+It is built once when the table is rolled up, so a "top 10 by value" panel is a slice of K positions
+and an `iloc` of K rows instead of a sort per rerun. When a new data version of the same table arrives
+(same rows, e.g. after an incremental daily append), `updated` re-ranks only the rows whose value
+changed and merges them into the kept order, instead of sorting every row again.
+"""
+import numpy as np
+import pandas as pd
+
+# Metrics ranked per summary table, and the columns identifying its rows
+RANK_METRICS = {
+    'regional_perf': ['total_value', 'total_transactions'],
+    'dc': ['total_value', 'total_transactions', 'avg_daily_value', 'avg_daily_count'],
+}
+RANK_KEYS = {
+    'regional_perf': ['Location'],
+    'dc': ['Domain', 'Location'],
+}
+
+
+def descending_order(values):
+    """Row positions by descending value; ties keep row order."""
+    return np.argsort(-values, kind='stable')
+
+
+def _merge_changed(order, values, changed):
+    """
+    Keeps the relative order of unchanged rows and inserts the re-sorted `changed` rows into it.
+    Ties are broken by row position as in descending_order, so the result equals a fresh sort.
+    """
+    kept = order[~changed[order]]
+    moved = np.flatnonzero(changed)
+    moved = moved[descending_order(values[moved])]
+    kept_values = -values[kept]
+    slots = np.searchsorted(kept_values, -values[moved], side='left')
+    ends = np.searchsorted(kept_values, -values[moved], side='right')
+    # Within a run of equal kept values the positions ascend, so a tied row goes before the first larger position
+    for i in np.flatnonzero(ends > slots):
+        slots[i] += np.searchsorted(kept[slots[i]:ends[i]], moved[i])
+    return np.insert(kept, slots, moved)
+
+
+class RankIndex:
+    """Descending row positions per metric of one table, with the row keys they refer to."""
+
+    def __init__(self, keys, values, orders):
+        self.keys = keys
+        self.values = values
+        self.orders = orders
+
+    @staticmethod
+    def _row_keys(df, key_columns):
+        return pd.util.hash_pandas_object(df[key_columns].astype(str), index=False).to_numpy()
+
+    @classmethod
+    def build(cls, df, metrics, key_columns):
+        """Sorts the rows of `df` once per metric."""
+        values = {metric: df[metric].to_numpy(dtype='float64') for metric in metrics}
+        return cls(
+            cls._row_keys(df, key_columns), values,
+            {metric: descending_order(column) for metric, column in values.items()},
+        )
+
+    def updated(self, df, key_columns):
+        """
+        RankIndex for a new version of the table. When the rows are the same keys in the same order, only
+        rows whose metric changed are re-sorted (O(n + m log m) for m changed rows); otherwise it is rebuilt.
+        """
+        keys = self._row_keys(df, key_columns)
+        if not np.array_equal(keys, self.keys):
+            return RankIndex.build(df, list(self.orders), key_columns)
+        values, orders = {}, {}
+        for metric, order in self.orders.items():
+            values[metric] = df[metric].to_numpy(dtype='float64')
+            changed = values[metric] != self.values[metric]
+            orders[metric] = order if not changed.any() else _merge_changed(order, values[metric], changed)
+        return RankIndex(keys, values, orders)
+
+    def top(self, metric, k=10):
+        """Positions of the `k` largest rows by `metric`."""
+        return self.orders[metric][:k]
+
+    def by_group(self, metric, labels):
+        """{label: positions of that label's rows in descending `metric` order} for a per-row label column."""
+        labels = pd.Series(labels).astype('category')
+        ordered_codes = labels.cat.codes.to_numpy()[self.orders[metric]]
+        return {label: self.orders[metric][ordered_codes == code] for code, label in enumerate(labels.cat.categories)}
+
+
+def top_k(df, index, metric, k=10):
+    """The `k` largest rows of `df` by `metric`, read from its RankIndex."""
+    return df.iloc[index.top(metric, k)]
@@ -0,0 +1,77 @@
+"""
+Column types for the raw file and every summary table the dashboard holds.
+
+Domain, Location and Cluster_Label are dictionary-encoded as pandas categoricals (an integer code per row
+plus one copy of each distinct name), counts are integers sized to their range, and money stays float64:
+float32 stops representing whole rupees above ~16.7 million and int32 would overflow on the totals.
+`apply_schema` is the one place summary tables are typed; `memory_report` compares deep memory use
+before and after.
+"""
+import pandas as pd
+
+LABEL_ORDER = ['HIGH_PERFORMANCE', 'MEDIUM_PERFORMANCE', 'LOW_PERFORMANCE']
+
+# Dates are parsed after aggregation, so they are read as categories too. Per-row counts are small;
+# sums over them are int64 (pandas upcasts int32 sums)
+RAW_DTYPES = {
+    'Date': 'category', 'Domain': 'category', 'Location': 'category',
+    'Value': 'float64', 'Transaction_count': 'int32',
+}
+
+# 'label' is Cluster_Label's ordered categorical (see label_dtype)
+TABLE_SCHEMAS = {
+    'domain_summary': {
+        'Domain': 'category', 'avg_daily_value': 'float64', 'avg_daily_count': 'float64',
+        'total_value': 'float64', 'total_transactions': 'int64', 'days_recorded': 'int16',
+    },
+    'regional_perf': {
+        'Location': 'category', 'avg_txn_value': 'float64', 'avg_txn_count': 'float64',
+        'total_transactions': 'int64', 'total_value': 'float64', 'days_recorded': 'int16',
+    },
+    'monthly_summary': {'total_value': 'float64', 'total_transactions': 'int64'},
+    'daily_summary': {'total_value': 'float64', 'total_transactions': 'int64'},
+    'dc': {
+        'Domain': 'category', 'Location': 'category', 'avg_daily_value': 'float64', 'avg_daily_count': 'float64',
+        'total_value': 'float64', 'total_transactions': 'int64', 'Cluster': 'int8', 'Cluster_Label': 'label',
+    },
+}
+
+
+def label_dtype(labels):
+    """Ordered categorical for cluster labels, so group-bys and sorts follow HIGH > MEDIUM > LOW."""
+    return pd.CategoricalDtype(LABEL_ORDER if set(labels) <= set(LABEL_ORDER) else sorted(set(labels)), ordered=True)
+
+
+def apply_schema(df, name):
+    """
+    Returns `df` with the column types of TABLE_SCHEMAS[name].
+    Missing numbers become 0, integer columns are rounded, and columns already categorical keep their categories.
+    """
+    columns = {}
+    for col, dtype in TABLE_SCHEMAS[name].items():
+        if col not in df:
+            continue
+        series = df[col]
+        if dtype in ('category', 'label'):
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                columns[col] = series.astype(label_dtype(series.dropna()) if dtype == 'label' else 'category')
+        elif dtype.startswith('int'):
+            columns[col] = pd.to_numeric(series, errors='coerce').fillna(0).round().astype(dtype)
+        else:
+            columns[col] = pd.to_numeric(series, errors='coerce').fillna(0).astype(dtype)
+    return df.assign(**columns)
+
+
+def frame_memory(df):
+    """Deep memory use of a DataFrame in bytes (object strings included)."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def memory_report(usage):
+    """
+    Turns {table: (bytes before typing, bytes after)} into one row per table with both sizes in KB
+    and the fraction saved.
+    """
+    report = pd.DataFrame.from_dict(usage, orient='index', columns=['Before_KB', 'After_KB']) / 1024
+    report['Saving'] = 1 - report['After_KB'] / report['Before_KB']
+    return report
@@ -0,0 +1,166 @@
+"""
+Process-wide cache shared by every dashboard session.
+
+Derived statistics and rendered figures are stored once per process under string keys, with a cap on
+the memory they hold (LRU eviction by estimated size) and an optional on-disk tier that survives
+restarts and is shared by worker processes. The disk tier has its own cap: after each write, the least
+recently used files (by modification time, which a disk hit refreshes) are removed until it fits. `get_or_compute` lets exactly one session compute a
+missing entry while concurrent sessions asking for the same key wait for its result, so N analysts
+looking at the same data cost about the CPU of one.
+"""
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+
+def value_size(value):
+    """Estimated memory held by a cached value, in bytes."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class SharedCache:
+    """Thread-safe LRU cache capped at `max_bytes`, with an optional pickle-per-key disk tier capped at `max_disk_bytes`."""
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, disk_dir=None, max_disk_bytes=1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.pkl")
+
+    def _remember(self, key, value):
+        size = value_size(value)
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= self._items.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._items[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                self._items.move_to_end(key)
+                return entry[0]
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            try:
+                with open(self._disk_path(key), 'rb') as fh:
+                    value = pickle.load(fh)
+                # Mark the file as recently used for the disk tier's eviction order
+                os.utime(self._disk_path(key))
+            except (OSError, EOFError, pickle.UnpicklingError):
+                return _MISSING
+            self._remember(key, value)
+            return value
+        return _MISSING
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key, default=None):
+        """Returns the value for `key` from memory or disk, or `default`."""
+        value = self._lookup(key)
+        self._count(hit=value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def put(self, key, value, persist=True):
+        """Stores `value` in memory and, if `persist` and a disk tier is configured, on disk."""
+        self._remember(key, value)
+        if persist and self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            tmp_path = f"{self._disk_path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._disk_path(key))
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Removes the least recently used disk entries until the disk tier fits in `max_disk_bytes`."""
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.pkl'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Another process sharing the directory removed it first
+                pass
+            total -= size
+            with self._lock:
+                self.disk_evictions += 1
+
+    def get_or_compute(self, key, compute, persist=True):
+        """
+        Returns the cached value for `key`, calling `compute()` on a miss.
+        Concurrent callers for the same key wait for the first one instead of computing it again.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self._count(hit=True)
+            return value
+        with self._lock:
+            key_lock = self._pending.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self._lookup(key)
+                self._count(hit=value is not _MISSING)
+                if value is _MISSING:
+                    value = compute()
+                    self.put(key, value, persist)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        return value
+
+    def stats(self):
+        """Entries, memory held and hit/miss/eviction counts."""
+        with self._lock:
+            return {
+                'entries': len(self._items),
+                'mb': self.nbytes / 1024 / 1024,
+                'max_mb': self.max_bytes / 1024 / 1024,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'disk_evictions': self.disk_evictions,
+            }
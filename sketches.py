@@ -0,0 +1,239 @@
+"""
+Mergeable sketches maintained during ingestion: distinct counts and transaction value percentiles.
+
+Distinct counts use HyperLogLog: every item is hashed to 64 bits, the first `precision` bits pick one
+of m = 2^precision registers and the register keeps the longest run of leading zeros (+1) seen in the
+remaining bits. The estimate has a relative standard error of 1.04 / sqrt(m); small cardinalities
+fall back to linear counting over the empty registers and are close to exact.
+
+Value percentiles use a relative-error quantile sketch (the DDSketch bucketing): a positive value v
+goes to bucket ceil(log_gamma(v)) with gamma = (1 + a) / (1 - a), and a bucket is reported as
+2 * gamma^k / (gamma + 1), so every quantile is within a relative error `a` of a value of that rank.
+Bucket keys for a whole chunk are one vectorised log, and merging two sketches is adding bucket counts.
+
+Both sketches are merged with a commutative, associative operation (register max, bucket sum), so
+chunks, ingest partitions and appended days combine to exactly the sketch of the whole file, in any
+order. They are kept as one long frame (Dimension, Key, Sketch, Bucket, Count) per Domain, per
+Location and for 'All', which stores and merges like every other table of the aggregate state.
+"""
+import numpy as np
+import pandas as pd
+
+HLL_PRECISION = 14
+RELATIVE_ACCURACY = 0.01
+# Error bounds are shown at about 95% (two standard errors)
+ERROR_Z = 2.0
+QUANTILES = [0.25, 0.5, 0.75, 0.9, 0.99]
+
+SKETCH_COLUMNS = ['Dimension', 'Key', 'Sketch', 'Bucket', 'Count']
+DIMENSIONS = ['All', 'Domain', 'Location']
+# Distinct items per sketch; a dimension sketches the items that do not include its own column
+DISTINCT_ITEMS = {
+    'Domain': ['Domain'],
+    'Location': ['Location'],
+    'Date': ['Date'],
+    'Pair': ['Domain', 'Location'],
+}
+# Value sketches: positive values by bucket, negative values by the bucket of their magnitude, zeros apart
+VALUE_STORES = {'value': 1, 'value:negative': -1, 'value:zero': 0}
+
+
+# --- HYPERLOGLOG ---
+
+def _bit_length(x):
+    """Exact bit length of each uint64 in `x`."""
+    x = x.copy()
+    length = np.zeros(len(x), dtype='int64')
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x >= np.uint64(1 << shift)
+        x[high] >>= np.uint64(shift)
+        length += high * shift
+    return length + (x > 0)
+
+
+def hll_registers(hashes, precision=HLL_PRECISION):
+    """(register index, rank) of each 64-bit hash; a register's value is the maximum rank hashed to it."""
+    hashes = np.asarray(hashes, dtype='uint64')
+    rest_bits = 64 - precision
+    index = (hashes >> np.uint64(rest_bits)).astype('int64')
+    rest = hashes & np.uint64((1 << rest_bits) - 1)
+    return index, rest_bits - _bit_length(rest) + 1
+
+
+def hll_estimate(registers, precision=HLL_PRECISION):
+    """Cardinality estimate from a dense register array."""
+    m = 1 << precision
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.sum(np.exp2(-registers.astype('float64')))
+    empty = int(np.count_nonzero(registers == 0))
+    if raw <= 2.5 * m and empty > 0:
+        return m * np.log(m / empty)
+    return raw
+
+
+def hll_error(precision=HLL_PRECISION):
+    """Relative standard error of a HyperLogLog estimate."""
+    return 1.04 / np.sqrt(1 << precision)
+
+
+# --- RELATIVE-ERROR QUANTILES ---
+
+def _gamma(accuracy=RELATIVE_ACCURACY):
+    return (1 + accuracy) / (1 - accuracy)
+
+
+def value_buckets(values, accuracy=RELATIVE_ACCURACY):
+    """(store sign, bucket key) of each value; zeros get key 0 in the zero store."""
+    values = np.asarray(values, dtype='float64')
+    sign = np.sign(values).astype('int64')
+    magnitude = np.abs(values)
+    with np.errstate(divide='ignore'):
+        keys = np.ceil(np.log(np.where(sign != 0, magnitude, 1.0)) / np.log(_gamma(accuracy))).astype('int64')
+    return sign, keys
+
+
+def bucket_value(sign, keys, accuracy=RELATIVE_ACCURACY):
+    """Representative value of each bucket (within `accuracy` of every value in it)."""
+    gamma = _gamma(accuracy)
+    return sign * 2 * np.power(gamma, keys) / (gamma + 1)
+
+
+def bucket_quantiles(sign, keys, counts, quantiles=QUANTILES, accuracy=RELATIVE_ACCURACY):
+    """Quantiles of the values counted in the given buckets (nearest-rank on the merged buckets)."""
+    counts = np.asarray(counts, dtype='int64')
+    values = bucket_value(np.asarray(sign), np.asarray(keys), accuracy)
+    order = np.argsort(values, kind='stable')
+    values, cumulative = values[order], np.cumsum(counts[order])
+    if not len(cumulative) or cumulative[-1] == 0:
+        return np.full(len(quantiles), np.nan)
+    ranks = np.asarray(quantiles) * (cumulative[-1] - 1)
+    return values[np.searchsorted(cumulative, ranks, side='right')]
+
+
+# --- SKETCH FRAMES ---
+
+def _sketch_frame(dimension, keys, sketch, buckets, counts):
+    return pd.DataFrame({
+        'Dimension': dimension, 'Key': keys, 'Sketch': sketch,
+        'Bucket': np.asarray(buckets, dtype='int64'), 'Count': np.asarray(counts, dtype='int64'),
+    }, columns=SKETCH_COLUMNS)
+
+
+def _empty():
+    return _sketch_frame([], [], [], [], [])
+
+
+def value_sketches(chunk, accuracy=RELATIVE_ACCURACY):
+    """Value sketches of a raw chunk (one row per transaction record) per Domain, per Location and for All."""
+    values = chunk['Value'].to_numpy(dtype='float64', na_value=np.nan)
+    valid = ~np.isnan(values)
+    sign, keys = value_buckets(values[valid], accuracy)
+    stores = np.array(list(VALUE_STORES), dtype=object)
+    store = np.select([sign > 0, sign < 0], [0, 1], 2)
+    offset, span = (keys.min(), keys.max() - keys.min() + 1) if len(keys) else (0, 1)
+    frames = []
+    for dimension in DIMENSIONS:
+        # One integer per (key, store, bucket), counted with a single sort instead of a string group-by
+        if dimension == 'All':
+            codes, names = np.zeros(len(keys), dtype='int64'), np.array(['All'], dtype=object)
+        else:
+            # Factorizing the (categorical) column works on its codes; rows without a key are left out, as in aggregate_chunk
+            codes, names = pd.factorize(chunk[dimension])
+            codes, names = codes[valid], np.asarray(names, dtype=str).astype(object)
+        keyed = codes >= 0
+        cells, counts = np.unique(((codes * len(stores) + store) * span + (keys - offset))[keyed], return_counts=True)
+        group, bucket = np.divmod(cells, span)
+        code, store_idx = np.divmod(group, len(stores))
+        frames.append(_sketch_frame(dimension, names[code], stores[store_idx], bucket + offset, counts))
+    return merge_sketches(frames)
+
+
+def distinct_sketches(partial, precision=HLL_PRECISION):
+    """
+    HyperLogLog sketches of the distinct Domains, Locations, days and Domain-City pairs in a
+    (Date, Domain, Location) partial, per Domain, per Location and for All. Duplicates do not change
+    a register, so sketching the partial gives the same registers as sketching every raw row.
+    """
+    # Each column is factorized once, so only its distinct names are formatted and hashed
+    codes, names = {}, {}
+    for col in ['Domain', 'Location', 'Date']:
+        codes[col], uniques = pd.factorize(partial[col])
+        uniques = pd.Series(uniques)
+        names[col] = (uniques.dt.strftime('%Y-%m-%d') if col == 'Date' else uniques.astype(str)).to_numpy(dtype=object)
+
+    frames = []
+    for dimension in DIMENSIONS:
+        for item, columns in DISTINCT_ITEMS.items():
+            if dimension in columns:
+                continue
+            used = columns if dimension == 'All' else [dimension] + columns
+            shape = tuple(len(names[col]) for col in used)
+            unique = np.unravel_index(np.unique(np.ravel_multi_index([codes[col] for col in used], shape)), shape)
+            items = names[columns[0]][unique[used.index(columns[0])]]
+            for col in columns[1:]:
+                items = items + '\x1f' + names[col][unique[used.index(col)]]
+            index, rank = hll_registers(pd.util.hash_array(items), precision)
+            keys = np.full(len(items), 'All', dtype=object) if dimension == 'All' else names[dimension][unique[0]]
+            registers = pd.DataFrame({'Key': keys, 'Bucket': index, 'Count': rank})
+            registers = registers.groupby(['Key', 'Bucket'], sort=False)['Count'].max().reset_index()
+            frames.append(registers.assign(Dimension=dimension, Sketch=f"distinct:{item}")[SKETCH_COLUMNS])
+    return merge_sketches(frames)
+
+
+def merge_sketches(frames):
+    """Merges sketch frames: maximum per HyperLogLog register, sum per value bucket."""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return _empty()
+    combined = pd.concat(frames, ignore_index=True)
+    distinct = combined['Sketch'].str.startswith('distinct:')
+    keys = ['Dimension', 'Key', 'Sketch', 'Bucket']
+    merged = pd.concat([
+        combined[distinct].groupby(keys, sort=False)['Count'].max().reset_index(),
+        combined[~distinct].groupby(keys, sort=False)['Count'].sum().reset_index(),
+    ], ignore_index=True)
+    return merged.sort_values(keys, ignore_index=True).astype({'Bucket': 'int64', 'Count': 'int64'})
+
+
+def _select(sketches, dimension, keys=None):
+    selected = sketches[sketches['Dimension'] == dimension]
+    if keys is not None:
+        selected = selected[selected['Key'].isin([str(k) for k in keys])]
+    return selected
+
+
+def distinct_counts(sketches, dimension='All', keys=None, precision=HLL_PRECISION, z=ERROR_Z):
+    """
+    Distinct-count estimates with their error bounds, one row per Key and distinct item:
+    Key, Sketch, estimate, lower, upper (estimate -/+ z standard errors).
+    """
+    selected = _select(sketches, dimension, keys)
+    rows = []
+    for (key, sketch), registers in selected[selected['Sketch'].str.startswith('distinct:')].groupby(['Key', 'Sketch'], sort=True):
+        dense = np.zeros(1 << precision, dtype='int64')
+        dense[registers['Bucket'].to_numpy()] = registers['Count'].to_numpy()
+        estimate = hll_estimate(dense, precision)
+        bound = z * hll_error(precision) * estimate
+        rows.append((key, sketch.split(':', 1)[1], estimate, max(estimate - bound, 0.0), estimate + bound))
+    return pd.DataFrame(rows, columns=['Key', 'Item', 'estimate', 'lower', 'upper'])
+
+
+def value_quantiles(sketches, dimension='All', keys=None, quantiles=QUANTILES, accuracy=RELATIVE_ACCURACY, combined=None):
+    """
+    Value percentiles per Key of `dimension` (optionally only `keys`): Key, records, p<q>... columns.
+    With `combined`, a row of that name is appended for the merge of every selected Key's sketch.
+    """
+    selected = _select(sketches, dimension, keys)
+    selected = selected[~selected['Sketch'].str.startswith('distinct:')]
+    columns = [f"p{round(q * 100):g}" for q in quantiles]
+
+    def row(buckets):
+        sign = buckets['Sketch'].map(VALUE_STORES).to_numpy()
+        values = bucket_quantiles(sign, buckets['Bucket'].to_numpy(), buckets['Count'].to_numpy(), quantiles, accuracy)
+        return [int(buckets['Count'].sum()), *values]
+
+    rows = [[key, *row(buckets)] for key, buckets in selected.groupby('Key', sort=True)]
+    if combined is not None and rows:
+        merged = selected.groupby(['Sketch', 'Bucket'], as_index=False)['Count'].sum()
+        rows.append([combined, *row(merged)])
+    return pd.DataFrame(rows, columns=['Key', 'records', *columns])
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import anomalies
+from cube import Cube
+
+WINDOW = 14
+
+
+def daily_cube(days, seed=0):
+    rng = np.random.default_rng(seed)
+    shape = (3, 4, days)
+    rows = rng.integers(0, 3, shape)
+    rows[2, 3] = 0
+    value = rng.normal(1000, 50, shape) * (rows > 0)
+    transactions = rng.integers(10, 20, shape) * (rows > 0)
+    dates = pd.date_range('2024-01-01', periods=days, freq='D')
+    return Cube(np.array(['D0', 'D1', 'D2']), np.array(['L0', 'L1', 'L2', 'L3']), dates, value, transactions, rows)
+
+
+def prefix(cube, days):
+    return Cube(cube.domains, cube.locations, cube.dates[:days],
+                cube.value[..., :days], cube.transactions[..., :days], cube.rows[..., :days])
+
+
+def assert_same_scan(left, right):
+    assert left.keys() == right.keys()
+    for key in left:
+        if isinstance(left[key], np.ndarray):
+            np.testing.assert_array_equal(left[key], right[key])
+    assert left['dates'].equals(right['dates'])
+
+
+@pytest.mark.parametrize('days', [WINDOW // 2, WINDOW, 40])
+def test_incremental_scan_equals_full_scan(days):
+    cube = daily_cube(60)
+    full = anomalies.scan(cube, WINDOW)
+    previous = anomalies.scan(prefix(cube, days), WINDOW)
+    extended = anomalies.scan(cube, WINDOW, previous=previous)
+    assert extended['scored_days'] == 60 - days
+    assert_same_scan({**extended, 'scored_days': 0}, {**full, 'scored_days': 0})
+
+
+def test_changed_history_is_rescored():
+    cube = daily_cube(60)
+    previous = anomalies.scan(prefix(cube, 40), WINDOW)
+    cube.value[0, 0, 5] += 1
+    extended = anomalies.scan(cube, WINDOW, previous=previous)
+    assert extended['scored_days'] == 60
+    assert_same_scan(extended, anomalies.scan(cube, WINDOW))
+
+
+def test_spikes_and_outages_are_flagged():
+    cube = daily_cube(60)
+    cube.rows[0, 1] = 1
+    cube.value[0, 1, 50] *= 10
+    cube.rows[1, 2, 45] = 0
+    flags = anomalies.flagged(anomalies.scan(cube, WINDOW), cube)
+    spike = flags[(flags['Domain'] == 'D0') & (flags['Location'] == 'L1') & (flags['Date'] == cube.dates[50])]
+    outage = flags[(flags['Domain'] == 'D1') & (flags['Location'] == 'L2') & (flags['Date'] == cube.dates[45])]
+    assert spike['Kind'].tolist() == ['spike']
+    assert outage['Kind'].tolist() == ['outage']
+    assert not ((flags['Domain'] == 'D2') & (flags['Location'] == 'L3')).any()
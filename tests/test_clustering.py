@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from clustering import iter_pair_day_features, pair_day_cells
+
+
+def raw_file(path, rows):
+    rows.to_csv(path, index=False)
+    return str(path)
+
+
+def test_pair_day_cells_do_not_depend_on_row_order(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 5000
+    rows = pd.DataFrame({
+        'Date': (pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 30, n), unit='D')).strftime('%Y-%m-%d'),
+        'Domain': [f"D{i}" for i in rng.integers(0, 3, n)],
+        'Location': [f"L{i}" for i in rng.integers(0, 5, n)],
+        'Value': rng.integers(1, 1000, n).astype('float64'),
+        'Transaction_count': rng.integers(1, 50, n),
+    })
+    shuffled = pair_day_cells(raw_file(tmp_path / 'shuffled.csv', rows), chunksize=700)
+    ordered = pair_day_cells(raw_file(tmp_path / 'ordered.csv', rows.sort_values('Date', kind='stable')), chunksize=700)
+
+    pd.testing.assert_frame_equal(shuffled, ordered)
+    assert len(shuffled) == len(rows[['Date', 'Domain', 'Location']].drop_duplicates())
+    features = pd.concat(iter_pair_day_features(shuffled, chunksize=100), ignore_index=True)
+    assert len(features) == len(shuffled)
+    assert features['total_value'].sum() == rows['Value'].sum()
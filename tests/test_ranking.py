@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ranking import RankIndex, descending_order
+
+METRICS = ['total_value', 'total_transactions']
+KEYS = ['Domain', 'Location']
+
+
+def pair_table(rng, n, values):
+    return pd.DataFrame({
+        'Domain': [f"D{i % 7}" for i in range(n)],
+        'Location': [f"L{i}" for i in range(n)],
+        'total_value': values(n),
+        'total_transactions': rng.integers(0, 5, n).astype('int64'),
+    })
+
+
+def test_descending_order_keeps_row_order_for_ties():
+    assert descending_order(np.array([1.0, 3.0, 1.0, 3.0])).tolist() == [1, 3, 0, 2]
+
+
+@pytest.mark.parametrize('integer_values', [True, False])
+def test_updated_equals_build(integer_values):
+    rng = np.random.default_rng(0)
+    values = (lambda n: rng.integers(0, 6, n).astype('float64')) if integer_values else (lambda n: rng.normal(size=n))
+    df = pair_table(rng, 200, values)
+    index = RankIndex.build(df, METRICS, KEYS)
+    for _ in range(300):
+        df = df.copy()
+        rows = rng.choice(len(df), size=rng.integers(1, 20), replace=False)
+        df.loc[rows, 'total_value'] = values(len(rows))
+        df.loc[rows, 'total_transactions'] = rng.integers(0, 5, len(rows))
+        index = index.updated(df, KEYS)
+        fresh = RankIndex.build(df, METRICS, KEYS)
+        for metric in METRICS:
+            np.testing.assert_array_equal(index.orders[metric], fresh.orders[metric])
+
+
+def test_updated_rebuilds_when_rows_change():
+    rng = np.random.default_rng(1)
+    df = pair_table(rng, 50, lambda n: rng.integers(0, 3, n).astype('float64'))
+    index = RankIndex.build(df, METRICS, KEYS).updated(df.iloc[::-1].reset_index(drop=True), KEYS)
+    fresh = RankIndex.build(df.iloc[::-1].reset_index(drop=True), METRICS, KEYS)
+    for metric in METRICS:
+        np.testing.assert_array_equal(index.orders[metric], fresh.orders[metric])
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sketches import (
+    RELATIVE_ACCURACY, distinct_counts, distinct_sketches, merge_sketches, value_quantiles, value_sketches,
+)
+
+QUANTILES = [0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def transactions(rng, n, domains=6, locations=400, days=365):
+    values = rng.lognormal(8, 1.5, n)
+    values[rng.random(n) < 0.05] *= -1
+    values[rng.random(n) < 0.02] = 0
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, days, n), unit='D'),
+        'Domain': pd.Categorical([f"D{i}" for i in rng.integers(0, domains, n)]),
+        'Location': pd.Categorical([f"L{i}" for i in rng.integers(0, locations, n)]),
+        'Value': values,
+    })
+
+
+def assert_same_sketches(left, right):
+    pd.testing.assert_frame_equal(left.reset_index(drop=True), right.reset_index(drop=True))
+
+
+@pytest.fixture(scope='module')
+def chunk():
+    return transactions(np.random.default_rng(0), 60_000)
+
+
+def test_distinct_counts_bound_the_exact_counts(chunk):
+    counts = distinct_counts(distinct_sketches(chunk)).set_index('Item')
+    exact = {
+        'Domain': chunk['Domain'].nunique(),
+        'Location': chunk['Location'].nunique(),
+        'Date': chunk['Date'].nunique(),
+        'Pair': len(chunk[['Domain', 'Location']].drop_duplicates()),
+    }
+    for item, value in exact.items():
+        row = counts.loc[item]
+        assert row['lower'] <= value <= row['upper']
+        assert abs(row['estimate'] - value) <= 0.02 * value + 1
+
+
+def test_distinct_counts_per_key(chunk):
+    counts = distinct_counts(distinct_sketches(chunk), 'Domain', keys=['D0', 'D3'])
+    exact = chunk.groupby('Domain', observed=True)['Location'].nunique()
+    locations = counts[counts['Item'] == 'Location'].set_index('Key')
+    assert list(locations.index) == ['D0', 'D3']
+    for key, row in locations.iterrows():
+        assert row['lower'] <= exact[key] <= row['upper']
+
+
+def nearest_rank(values, quantiles):
+    ordered = np.sort(values)
+    return ordered[np.floor(np.asarray(quantiles) * (len(ordered) - 1)).astype(int)]
+
+
+def test_value_quantiles_within_relative_accuracy(chunk):
+    sketches = value_sketches(chunk)
+    quantiles = value_quantiles(sketches, 'Domain', quantiles=QUANTILES, combined='All selected').set_index('Key')
+    columns = [f"p{round(q * 100):g}" for q in QUANTILES]
+    groups = dict(list(chunk.groupby('Domain', observed=True)['Value']))
+    groups['All selected'] = chunk['Value']
+    for key, values in groups.items():
+        exact = nearest_rank(values.to_numpy(), QUANTILES)
+        estimate = quantiles.loc[key, columns].to_numpy(dtype='float64')
+        assert quantiles.loc[key, 'records'] == len(values)
+        np.testing.assert_array_less(np.abs(estimate - exact), RELATIVE_ACCURACY * np.abs(exact) + 1e-9)
+
+
+@pytest.mark.parametrize('sketch', [value_sketches, distinct_sketches])
+def test_merge_is_independent_of_partition(chunk, sketch):
+    whole = sketch(chunk)
+    rng = np.random.default_rng(1)
+    for parts in (2, 5):
+        cuts = np.sort(rng.choice(np.arange(1, len(chunk)), parts - 1, replace=False))
+        pieces = [chunk.iloc[start:stop] for start, stop in zip([0, *cuts], [*cuts, len(chunk)])]
+        assert_same_sketches(merge_sketches([sketch(piece) for piece in pieces]), whole)
+
+
+@pytest.mark.parametrize('sketch', [value_sketches, distinct_sketches])
+def test_merge_is_associative_and_commutative(chunk, sketch):
+    a, b, c = (sketch(chunk.iloc[i::3]) for i in range(3))
+    left = merge_sketches([merge_sketches([a, b]), c])
+    right = merge_sketches([a, merge_sketches([b, c])])
+    assert_same_sketches(left, right)
+    assert_same_sketches(merge_sketches([c, a, b]), left)